@@ -2,6 +2,11 @@ import pygame
 import sys
 import random
 import time
+import os
+import math
+from collections import OrderedDict
+import numpy as np
+from multiprocessing import Pool, shared_memory
 
 # -------- Config --------
 WIDTH, HEIGHT = 1100, 600 
@@ -13,10 +18,17 @@ PANEL_COLOR = (40, 40, 40)
 POINT_COLOR = (255, 200, 50)
 DDA_COLOR = (50, 200, 255)
 BRES_COLOR = (255, 90, 90)
+WU_COLOR = (120, 255, 140)
+SYM_COLOR = (200, 120, 255)
+HATCH_COLOR = (90, 140, 90)
+THICK_COLOR = (255, 160, 60)
 TEXT_COLOR = (230, 230, 230)
 ACCENT_COLOR = (180, 180, 180)
 
 BENCH_LINES = 3000
+BAND_CHUNK = 100_000  # lines rasterized per step inside a band worker
+CACHE_BYTES = 8 * 1024 * 1024  # memory budget of the line offset cache
+THICK_WIDTH = 7
 # -------------------------
 
 
@@ -63,6 +75,447 @@ def bresenham(surface, x0, y0, x1, y1, color):
                 err += dy
 
 
+def draw_thick_line(surface, x0, y0, x1, y1, color, width=5):
+    """Thick line with round caps, rasterized as one horizontal span per row.
+
+    The stroke is every point within width/2 of the segment (a capsule).
+    That shape is convex, so each scanline crosses it in a single interval:
+    the union of the body's interval and the two end disks' intervals.
+    Spans are written as array slices, O(length * width) pixels in one
+    pass, and the surface clip rect is respected. Returns pixels written.
+    """
+    h = width / 2.0
+    length = math.hypot(x1 - x0, y1 - y0)
+    clip = surface.get_clip()
+    y_lo = max(math.ceil(min(y0, y1) - h), clip.top)
+    y_hi = min(math.floor(max(y0, y1) + h), clip.bottom - 1)
+    if y_lo > y_hi:
+        return 0
+    ys = np.arange(y_lo, y_hi + 1, dtype=np.float64)
+
+    lefts = np.full(ys.shape, np.inf)
+    rights = np.full(ys.shape, -np.inf)
+
+    # End disks
+    for cx, cy in ((x0, y0), (x1, y1)):
+        r2 = h * h - (ys - cy) ** 2
+        inside = r2 >= 0
+        half = np.sqrt(np.where(inside, r2, 0.0))
+        lefts = np.where(inside, np.minimum(lefts, cx - half), lefts)
+        rights = np.where(inside, np.maximum(rights, cx + half), rights)
+
+    # Body: 0 <= along <= length and |across| <= h, each linear in x per row
+    if length > 0:
+        ux, uy = (x1 - x0) / length, (y1 - y0) / length
+        lo, hi = np.full(ys.shape, -np.inf), np.full(ys.shape, np.inf)
+        for c, d, a, b in ((ux, uy, 0.0, length), (-uy, ux, -h, h)):
+            t = d * (ys - y0)
+            if abs(c) > 1e-12:
+                e0, e1 = x0 + (a - t) / c, x0 + (b - t) / c
+                lo, hi = np.maximum(lo, np.minimum(e0, e1)), np.minimum(hi, np.maximum(e0, e1))
+            else:
+                empty = (t < a) | (t > b)
+                lo, hi = np.where(empty, np.inf, lo), np.where(empty, -np.inf, hi)
+        body = lo <= hi
+        lefts = np.where(body, np.minimum(lefts, lo), lefts)
+        rights = np.where(body, np.maximum(rights, hi), rights)
+
+    rows = np.isfinite(lefts)
+    lefts = np.maximum(np.ceil(lefts[rows] - 1e-9), clip.left).astype(int)
+    rights = np.minimum(np.floor(rights[rows] + 1e-9), clip.right - 1).astype(int)
+    ys = ys[rows].astype(int)
+
+    value = surface.map_rgb(color)
+    pixels = pygame.surfarray.pixels2d(surface)
+    written = 0
+    for y, left, right in zip(ys.tolist(), lefts.tolist(), rights.tolist()):
+        if left <= right:
+            pixels[left:right + 1, y] = value
+            written += right - left + 1
+    del pixels
+    return written
+
+
+def bresenham_symmetric(surface, x0, y0, x1, y1, color):
+    """Double-step Bresenham drawn from both ends towards the midpoint.
+
+    A Bresenham line is symmetric about its midpoint, so one walk starts at
+    each endpoint. Each decision advances both walks by two pixels, i.e.
+    four pixels per decision. The backward walk tracks the mirrored error
+    term (ties broken the other way), so the pixel set matches `bresenham`
+    exactly.
+    """
+    x0, y0, x1, y1 = map(int, [round(x0), round(y0), round(x1), round(y1)])
+    dx, dy = abs(x1 - x0), abs(y1 - y0)
+    sx, sy = (1 if x0 < x1 else -1), (1 if y0 < y1 else -1)
+
+    # Walk in (major, minor) coordinates; `swap` maps them back to (x, y)
+    swap = dy > dx
+    if swap:
+        m, q = dy, dx
+        a0, b0, a1, b1, sa, sb = y0, x0, y1, x1, sy, sx
+    else:
+        m, q = dx, dy
+        a0, b0, a1, b1, sa, sb = x0, y0, x1, y1, sx, sy
+    set_at = surface.set_at
+    color = surface.map_rgb(color)  # set_at skips the per-pixel colour parse
+
+    set_at((x0, y0), color)
+    if m == 0:
+        return
+    set_at((x1, y1), color)
+
+    q2, mq, mq2 = 2 * q, m - q, m - 2 * q
+    f = r = m // 2  # forward error as in `bresenham`, backward mirrored
+    fa, fb, ba, bb = a0, b0, a1, b1
+    left = m - 1  # pixels still to plot between the two walks
+
+    while left >= 4:
+        # Forward: pick the pattern for the next two pixels from f;
+        # fmid is the minor coordinate of the first of them
+        fa += sa
+        if f >= q2:
+            f -= q2
+            fmid = fb
+        elif f >= q:
+            f += mq2
+            fmid = fb
+            fb += sb
+        else:
+            f += mq
+            fb += sb
+            fmid = fb
+            if f < q:
+                f += mq
+                fb += sb
+            else:
+                f -= q
+
+        # Backward: same patterns mirrored, carries when r reaches m
+        ba -= sa
+        if r + q2 < m:
+            r += q2
+            bmid = bb
+        elif r + q < m:
+            r -= mq2
+            bmid = bb
+            bb -= sb
+        else:
+            r -= mq
+            bb -= sb
+            bmid = bb
+            if r + q >= m:
+                r -= mq
+                bb -= sb
+            else:
+                r += q
+
+        if swap:
+            set_at((fmid, fa), color)
+            set_at((fb, fa + sa), color)
+            set_at((bmid, ba), color)
+            set_at((bb, ba - sa), color)
+        else:
+            set_at((fa, fmid), color)
+            set_at((fa + sa, fb), color)
+            set_at((ba, bmid), color)
+            set_at((ba - sa, bb), color)
+        fa += sa
+        ba -= sa
+        left -= 4
+
+    # Fewer than four pixels in the middle: finish with single forward steps
+    for _ in range(left):
+        fa += sa
+        f -= q
+        if f < 0:
+            fb += sb
+            f += m
+        set_at((fb, fa) if swap else (fa, fb), color)
+
+
+class _PixelRecorder:
+    """Stands in for a surface and records the pixels an algorithm plots"""
+
+    def __init__(self):
+        self.points = []
+
+    def set_at(self, pos, color):
+        self.points.append(pos)
+
+    def map_rgb(self, color):
+        return color
+
+
+class LineCache:
+    """LRU cache of line pixel offsets keyed by (dx, dy, algorithm).
+
+    A miss runs the real algorithm once from the origin and stores the
+    relative offsets. A hit only translates them to the line's start.
+    Entries are evicted least recently used first once their arrays exceed
+    `max_bytes`. Only integer-exact algorithms can be cached. DDA is left
+    out because `round` sends .5 to the even neighbour, so
+    `x0 + round(t) != round(x0 + t)` whenever x0 is odd and t is a tie.
+    """
+
+    def __init__(self, max_bytes=CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def offsets(self, dx, dy, algorithm):
+        key = (dx, dy, algorithm)
+        offsets = self.entries.get(key)
+        if offsets is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return offsets
+
+        if algorithm not in LINE_ALGORITHMS:
+            raise ValueError(f"cannot cache {algorithm!r} lines; use one of {sorted(LINE_ALGORITHMS)}")
+        self.misses += 1
+        recorder = _PixelRecorder()
+        LINE_ALGORITHMS[algorithm](recorder, 0, 0, dx, dy, None)
+        offsets = np.array(recorder.points, dtype=np.int32).reshape(-1, 2)
+        offsets.setflags(write=False)
+
+        self.entries[key] = offsets
+        self.bytes += offsets.nbytes
+        while self.bytes > self.max_bytes and len(self.entries) > 1:
+            _, evicted = self.entries.popitem(last=False)
+            self.bytes -= evicted.nbytes
+        return offsets
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self.entries),
+            "bytes": self.bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def clear(self):
+        self.entries.clear()
+        self.bytes = self.hits = self.misses = 0
+
+
+# Translation-invariant line algorithms, i.e. those LineCache can replay
+LINE_ALGORITHMS = {
+    "bresenham": bresenham,
+    "symmetric": bresenham_symmetric,
+}
+LINE_CACHE = LineCache()
+
+
+def draw_lines_cached(surface, lines, color, algorithm="bresenham", cache=LINE_CACHE):
+    """Draw many lines from cached offsets with a single scatter write"""
+    chunks = []
+    for x0, y0, x1, y1 in lines:
+        x0, y0, x1, y1 = map(int, [round(x0), round(y0), round(x1), round(y1)])
+        chunks.append(cache.offsets(x1 - x0, y1 - y0, algorithm) + (x0, y0))
+    if not chunks:
+        return
+    points = np.concatenate(chunks)
+    width, height = surface.get_size()
+    keep = (points[:, 0] >= 0) & (points[:, 0] < width) & (points[:, 1] >= 0) & (points[:, 1] < height)
+    points = points[keep]
+    pixels = pygame.surfarray.pixels2d(surface)
+    pixels[points[:, 0], points[:, 1]] = surface.map_rgb(color)
+    del pixels
+
+
+def hatch_lines(spacing=12, length=60):
+    """Diagonal hatching over DRAW_AREA; every line shares the same delta"""
+    return [(x, y, x + length, y + length)
+            for y in range(-length, DRAW_AREA[1], spacing)
+            for x in range(-length, DRAW_AREA[0], spacing)]
+
+
+def bresenham_band(lines, y_lo, y_hi, width):
+    """Pixels of `bresenham` for many integer lines, clipped to rows [y_lo, y_hi).
+
+    Uses the closed form of the Bresenham error term: with major delta m,
+    minor delta q and starting error m // 2, pixel i sits ceil((i*q - m//2) / m)
+    minor steps from the start. Inverting that gives the exact range of i
+    that falls inside the band, so each line is clipped before any pixel
+    is generated. Returns (xs, ys) arrays.
+    """
+    lines = np.asarray(lines, dtype=np.int64).reshape(-1, 4)
+    x0, y0, x1, y1 = lines.T
+    dx, dy = np.abs(x1 - x0), np.abs(y1 - y0)
+    sx = np.where(x0 < x1, 1, -1)
+    sy = np.where(y0 < y1, 1, -1)
+    x_major = dy <= dx
+    m = np.where(x_major, dx, dy)
+    q = np.where(x_major, dy, dx)
+    e0 = m // 2
+
+    # Band as a range of y offsets from the start of each line
+    off_lo = np.where(sy > 0, y_lo - y0, y0 - (y_hi - 1))
+    off_hi = np.where(sy > 0, y_hi - 1 - y0, y0 - y_lo)
+
+    # y-major lines step y once per pixel, so the band maps to i directly
+    i_lo = np.maximum(off_lo, 0)
+    i_hi = np.minimum(off_hi, m)
+
+    # x-major lines: invert k_i >= K  <=>  i >= ((K - 1) * m + e0) // q + 1
+    k_lo = np.maximum(off_lo, 0)
+    k_hi = np.minimum(off_hi, q)
+    q_safe = np.maximum(q, 1)
+    xi_lo = np.where(q > 0, ((k_lo - 1) * m + e0) // q_safe + 1, 0)
+    xi_hi = np.where(q > 0, (k_hi * m + e0) // q_safe, m)
+    xi_lo = np.where(k_lo <= k_hi, np.maximum(xi_lo, 0), 1)
+    xi_hi = np.where(k_lo <= k_hi, np.minimum(xi_hi, m), 0)
+
+    i_lo = np.where(x_major, xi_lo, i_lo)
+    i_hi = np.where(x_major, xi_hi, i_hi)
+
+    counts = np.maximum(i_hi - i_lo + 1, 0)
+    idx = np.repeat(np.arange(len(lines)), counts)
+    i = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts) + i_lo[idx]
+
+    m_i, q_i = np.maximum(m[idx], 1), q[idx]
+    k = -((e0[idx] - i * q_i) // m_i)
+    major = np.where(x_major[idx], x0[idx] + sx[idx] * i, y0[idx] + sy[idx] * i)
+    minor = np.where(x_major[idx], y0[idx] + sy[idx] * k, x0[idx] + sx[idx] * k)
+    xs = np.where(x_major[idx], major, minor)
+    ys = np.where(x_major[idx], minor, major)
+
+    keep = (xs >= 0) & (xs < width)
+    return xs[keep], ys[keep]
+
+
+def _bresenham_band_worker(args):
+    """Rasterize one horizontal band into its own rows of the shared canvas"""
+    lines_name, n_lines, canvas_name, shape, y_lo, y_hi, value = args
+    lines_shm = shared_memory.SharedMemory(name=lines_name)
+    canvas_shm = shared_memory.SharedMemory(name=canvas_name)
+    try:
+        lines = np.ndarray((n_lines, 4), dtype=np.int64, buffer=lines_shm.buf)
+        canvas = np.ndarray(shape, dtype=np.uint32, buffer=canvas_shm.buf)
+        for start in range(0, n_lines, BAND_CHUNK):
+            xs, ys = bresenham_band(lines[start:start + BAND_CHUNK], y_lo, y_hi, shape[1])
+            canvas[ys, xs] = value
+        del lines, canvas
+    finally:
+        lines_shm.close()
+        canvas_shm.close()
+
+
+def bresenham_parallel(surface, lines, color, workers=None):
+    """Draw a large batch of lines with one worker process per horizontal band.
+
+    DRAW_AREA is split into `workers` bands of rows. Every worker clips all
+    lines to its band and writes into a disjoint row slice of a shared-memory
+    canvas, so no locking is needed and the result is bit-identical to
+    calling `bresenham` on every line.
+    """
+    workers = workers or os.cpu_count() or 1
+    width, height = surface.get_size()
+    lines = np.round(np.asarray(lines, dtype=np.float64)).astype(np.int64).reshape(-1, 4)
+    shape = (height, width)
+
+    lines_shm = shared_memory.SharedMemory(create=True, size=max(lines.nbytes, 1))
+    canvas_shm = shared_memory.SharedMemory(create=True, size=height * width * 4)
+    try:
+        np.ndarray(lines.shape, dtype=np.int64, buffer=lines_shm.buf)[:] = lines
+        canvas = np.ndarray(shape, dtype=np.uint32, buffer=canvas_shm.buf)
+        pixels = pygame.surfarray.pixels2d(surface)
+        canvas[:] = pixels.T
+
+        bounds = np.linspace(0, height, workers + 1).astype(int)
+        jobs = [(lines_shm.name, len(lines), canvas_shm.name, shape,
+                 int(bounds[b]), int(bounds[b + 1]), surface.map_rgb(color))
+                for b in range(workers) if bounds[b] < bounds[b + 1]]
+        # close/join rather than the context manager's terminate(): workers
+        # forked after pygame.init() inherit SDL's SIGTERM handler and hang
+        pool = Pool(len(jobs))
+        try:
+            pool.map(_bresenham_band_worker, jobs)
+        finally:
+            pool.close()
+            pool.join()
+
+        pixels[...] = canvas.T
+        del pixels, canvas
+    finally:
+        lines_shm.close()
+        lines_shm.unlink()
+        canvas_shm.close()
+        canvas_shm.unlink()
+
+
+def wu_lines(coverage, lines):
+    """Xiaolin Wu anti-aliased lines, accumulated into a float coverage buffer.
+
+    `coverage` is a float array shaped like the target surface (x, y) and
+    `lines` is an (N, 4) array of x0, y0, x1, y1. Every line is expanded at
+    once with NumPy and the fractional coverage is summed with a single
+    bincount, so there is no per-pixel Python work at all.
+    """
+    lines = np.asarray(lines, dtype=np.float64).reshape(-1, 4)
+    if len(lines) == 0:
+        return
+    x0, y0, x1, y1 = lines.T
+
+    # Work along the major axis (a) with the minor axis (b) as the fraction
+    steep = np.abs(y1 - y0) > np.abs(x1 - x0)
+    a0, b0 = np.where(steep, y0, x0), np.where(steep, x0, y0)
+    a1, b1 = np.where(steep, y1, x1), np.where(steep, x1, y1)
+    flip = a0 > a1
+    a0, a1 = np.where(flip, a1, a0), np.where(flip, a0, a1)
+    b0, b1 = np.where(flip, b1, b0), np.where(flip, b0, b1)
+
+    da = a1 - a0
+    grad = np.divide(b1 - b0, da, out=np.ones_like(da), where=da != 0)
+
+    # Endpoints: partial coverage along the major axis as well
+    aend0 = np.floor(a0 + 0.5)
+    bend0 = b0 + grad * (aend0 - a0)
+    gap0 = 1.0 - ((a0 + 0.5) - np.floor(a0 + 0.5))
+    aend1 = np.floor(a1 + 0.5)
+    bend1 = b1 + grad * (aend1 - a1)
+    gap1 = (a1 + 0.5) - np.floor(a1 + 0.5)
+
+    # Interior samples, one per major-axis step, for every line at once
+    counts = np.maximum(aend1 - aend0 - 1, 0).astype(np.int64)
+    idx = np.repeat(np.arange(len(lines)), counts)
+    step = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts) + 1
+
+    a = np.concatenate([aend0, aend1, aend0[idx] + step])
+    b = np.concatenate([bend0, bend1, bend0[idx] + grad[idx] * step])
+    w = np.concatenate([gap0, gap1, np.ones(len(idx))])
+    is_steep = np.concatenate([steep, steep, steep[idx]])
+
+    bi = np.floor(b)
+    frac = b - bi
+    a = np.concatenate([a, a]).astype(np.int64)
+    b = np.concatenate([bi, bi + 1]).astype(np.int64)
+    w = np.concatenate([w * (1.0 - frac), w * frac])
+    is_steep = np.concatenate([is_steep, is_steep])
+
+    xs = np.where(is_steep, b, a)
+    ys = np.where(is_steep, a, b)
+    width, height = coverage.shape
+    keep = (xs >= 0) & (xs < width) & (ys >= 0) & (ys < height) & (w > 0)
+    flat = xs[keep] * height + ys[keep]
+    coverage += np.bincount(flat, weights=w[keep], minlength=width * height).reshape(width, height)
+
+
+def resolve_coverage(surface, coverage, color):
+    """Blend a coverage buffer into the surface in one pass, then clear it"""
+    alpha = np.clip(coverage, 0.0, 1.0)[..., None]
+    pixels = pygame.surfarray.pixels3d(surface)
+    blended = pixels * (1.0 - alpha) + np.asarray(color, dtype=np.float64) * alpha
+    pixels[...] = (blended + 0.5).astype(np.uint8)
+    del pixels
+    coverage.fill(0.0)
+
+
 def run_benchmark():
     surf = pygame.Surface(DRAW_AREA)
     pairs = [(random.randint(0, DRAW_AREA[0]-1), random.randint(0, DRAW_AREA[1]-1),
@@ -81,7 +534,42 @@ def run_benchmark():
         bresenham(surf, x0, y0, x1, y1, (1, 1, 1))
     bres_time = time.perf_counter() - t0
 
-    return dda_time, bres_time
+    # Symmetric double-step Bresenham
+    t0 = time.perf_counter()
+    for (x0, y0, x1, y1) in pairs:
+        bresenham_symmetric(surf, x0, y0, x1, y1, (1, 1, 1))
+    sym_time = time.perf_counter() - t0
+
+    # Bresenham, banded across worker processes
+    t0 = time.perf_counter()
+    bresenham_parallel(surf, pairs, (1, 1, 1))
+    parallel_time = time.perf_counter() - t0
+
+    # Cached offsets on a hatching-style workload with repeated deltas
+    deltas = [(random.randint(-40, 40), random.randint(-40, 40)) for _ in range(50)]
+    hatch = []
+    for _ in range(BENCH_LINES):
+        x0, y0 = random.randint(0, DRAW_AREA[0]-1), random.randint(0, DRAW_AREA[1]-1)
+        ddx, ddy = random.choice(deltas)
+        hatch.append((x0, y0, x0 + ddx, y0 + ddy))
+    cache = LineCache()
+    t0 = time.perf_counter()
+    draw_lines_cached(surf, hatch, (1, 1, 1), cache=cache)
+    cached_time = time.perf_counter() - t0
+
+    # Wu, whole batch at once plus a single resolve
+    coverage = np.zeros(DRAW_AREA, dtype=np.float32)
+    t0 = time.perf_counter()
+    wu_lines(coverage, pairs)
+    resolve_coverage(surf, coverage, (1, 1, 1))
+    wu_time = time.perf_counter() - t0
+
+    return [("DDA", dda_time, DDA_COLOR),
+            ("Bres", bres_time, BRES_COLOR),
+            ("Bres MP", parallel_time, BRES_COLOR),
+            ("Sym x2", sym_time, SYM_COLOR),
+            (f"Cache {cache.stats()['hit_rate']:.0%}", cached_time, HATCH_COLOR),
+            ("Wu", wu_time, WU_COLOR)]
 
 
 def draw_panel(screen, font, small_font, points, bench_result):
@@ -102,6 +590,10 @@ def draw_panel(screen, font, small_font, points, bench_result):
         "Click 2 points in left area",
         "D - Draw DDA (cyan)",
         "B - Draw Bresenham (red)",
+        "X - Draw Symmetric 2-step (purple)",
+        "W - Draw Wu anti-aliased (green)",
+        "T - Draw Thick line (orange)",
+        "H - Hatch area (cached offsets)",
         "A - Draw Both",
         "C - Clear screen",
         "S - Run Benchmark"
@@ -123,15 +615,13 @@ def draw_panel(screen, font, small_font, points, bench_result):
 
     # Benchmark results
     if bench_result:
-        dda_time, bres_time = bench_result
         y += 30
         screen.blit(font.render("Benchmark:", True, ACCENT_COLOR), (panel_x + 20, y))
         y += 40
-        screen.blit(small_font.render(
-            f"DDA: {dda_time:.5f} s ({dda_time/BENCH_LINES*1e6:.2f} µs/line)", True, DDA_COLOR), (panel_x + 20, y))
-        y += 30
-        screen.blit(small_font.render(
-            f"Bres: {bres_time:.5f} s ({bres_time/BENCH_LINES*1e6:.2f} µs/line)", True, BRES_COLOR), (panel_x + 20, y))
+        for label, seconds, color in bench_result:
+            screen.blit(small_font.render(
+                f"{label}: {seconds:.5f} s ({seconds/BENCH_LINES*1e6:.2f} µs/line)", True, color), (panel_x + 20, y))
+            y += 25
 
 
 def main():
@@ -144,6 +634,7 @@ def main():
 
     draw_surface = pygame.Surface(DRAW_AREA)
     draw_surface.fill(BG_COLOR)
+    coverage = np.zeros(DRAW_AREA, dtype=np.float32)
 
     points = []
     bench_result = None
@@ -169,6 +660,15 @@ def main():
                     dda(draw_surface, *points[0], *points[1], DDA_COLOR)
                 elif ev.key == pygame.K_b and len(points) == 2:
                     bresenham(draw_surface, *points[0], *points[1], BRES_COLOR)
+                elif ev.key == pygame.K_x and len(points) == 2:
+                    bresenham_symmetric(draw_surface, *points[0], *points[1], SYM_COLOR)
+                elif ev.key == pygame.K_w and len(points) == 2:
+                    wu_lines(coverage, [(*points[0], *points[1])])
+                    resolve_coverage(draw_surface, coverage, WU_COLOR)
+                elif ev.key == pygame.K_t and len(points) == 2:
+                    draw_thick_line(draw_surface, *points[0], *points[1], THICK_COLOR, THICK_WIDTH)
+                elif ev.key == pygame.K_h:
+                    draw_lines_cached(draw_surface, hatch_lines(), HATCH_COLOR)
                 elif ev.key == pygame.K_a and len(points) == 2:
                     dda(draw_surface, *points[0], *points[1], DDA_COLOR)
                     bresenham(draw_surface, *points[0], *points[1], BRES_COLOR)
@@ -0,0 +1,89 @@
+import os
+import random
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+import pytest
+
+from lineDrawing import LineCache, bresenham, bresenham_parallel, bresenham_symmetric, draw_lines_cached
+
+SIZE = 64
+
+
+def plotted(algorithm, line):
+    """Set of pixels `algorithm` lights on a fresh SIZE x SIZE surface"""
+    surface = pygame.Surface((SIZE, SIZE))
+    algorithm(surface, *line, (255, 255, 255))
+    pixels = pygame.surfarray.array2d(surface)
+    return set(zip(*pixels.nonzero()))
+
+
+def random_lines(count, seed):
+    rng = random.Random(seed)
+    return [tuple(rng.randrange(SIZE) for _ in range(4)) for _ in range(count)]
+
+
+@pytest.mark.parametrize("line", [
+    (10, 10, 10, 10),           # single point
+    (0, 20, 63, 20),            # horizontal
+    (20, 0, 20, 63),            # vertical
+    (0, 0, 63, 63),             # diagonal
+    (63, 0, 0, 63),             # anti-diagonal
+    (5, 7, 8, 9),               # shorter than one double step
+    (0, 0, 63, 1),              # tie-heavy shallow slope
+    (0, 0, 1, 63),              # tie-heavy steep slope
+])
+def test_symmetric_matches_bresenham_edge_cases(line):
+    assert plotted(bresenham_symmetric, line) == plotted(bresenham, line)
+
+
+def test_symmetric_matches_bresenham_random_lines():
+    for line in random_lines(2000, seed=0):
+        assert plotted(bresenham_symmetric, line) == plotted(bresenham, line), line
+
+
+def test_symmetric_clips_offscreen_pixels_like_bresenham():
+    for line in [(-10, 5, 80, 40), (30, -20, 40, 90), (-5, -5, 70, 70)]:
+        assert plotted(bresenham_symmetric, line) == plotted(bresenham, line), line
+
+
+@pytest.mark.parametrize("algorithm, direct", [
+    ("bresenham", bresenham),
+    ("symmetric", bresenham_symmetric),
+])
+def test_cached_lines_match_direct_drawing(algorithm, direct):
+    lines = random_lines(500, seed=1) + [(x, y, x + 7, y + 3) for x, y in [(-4, 2), (60, 60), (9, 30)]]
+    cached = pygame.Surface((SIZE, SIZE))
+    draw_lines_cached(cached, lines, (255, 255, 255), algorithm, cache=LineCache())
+    expected = pygame.Surface((SIZE, SIZE))
+    for line in lines:
+        direct(expected, *line, (255, 255, 255))
+    assert (pygame.surfarray.array2d(cached) == pygame.surfarray.array2d(expected)).all()
+
+
+def test_cache_rejects_dda():
+    with pytest.raises(ValueError):
+        draw_lines_cached(pygame.Surface((SIZE, SIZE)), [(0, 0, 5, 3)], (255, 255, 255), "dda", cache=LineCache())
+
+
+@pytest.fixture
+def display():
+    """pygame initialised with a window, as in the GUI"""
+    pygame.init()
+    pygame.display.set_mode((SIZE, SIZE))
+    yield
+    pygame.quit()
+
+
+def test_parallel_runs_repeatedly_after_pygame_init(display):
+    # Workers forked after pygame.init() ignore SIGTERM, so a pool that is
+    # terminated instead of joined could hang on any later call
+    lines = random_lines(300, seed=2)
+    expected = pygame.Surface((SIZE, SIZE))
+    for line in lines:
+        bresenham(expected, *line, (255, 255, 255))
+    for _ in range(10):
+        surface = pygame.Surface((SIZE, SIZE))
+        bresenham_parallel(surface, lines, (255, 255, 255), workers=4)
+        assert (pygame.surfarray.array2d(surface) == pygame.surfarray.array2d(expected)).all()
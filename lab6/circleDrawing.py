@@ -1,7 +1,13 @@
+import os
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")  # keep --bench stdout pure JSON
 import pygame
 import sys
 import random
 import time
+import json
+import argparse
+from functools import lru_cache
+import numpy as np
 
 # -------- Config --------
 WIDTH, HEIGHT = 1100, 650  
@@ -13,10 +19,23 @@ PANEL_COLOR = (40, 40, 40)
 CENTER_COLOR = (255, 200, 50)
 MIDPOINT_COLOR = (50, 200, 255)
 BRES_COLOR = (255, 90, 90)
+CACHED_COLOR = (120, 255, 140)
+FILL_COLOR = (90, 120, 200)
+ELLIPSE_COLOR = (255, 120, 200)
+PARAM_COLOR = (200, 200, 120)
+AA_COLOR = (255, 255, 255)
 TEXT_COLOR = (230, 230, 230)
 ACCENT_COLOR = (180, 180, 180)
 
 BENCH_CIRCLES = 1000
+BENCH_SEED = 0
+BENCH_REPEATS = 10
+SWEEP_CIRCLES = 200
+SWEEP_BUCKETS = ((1, 10), (10, 100), (100, 1000))  # inclusive radius ranges
+SWEEP_GROUP = 10  # circles per timed sample for the one-circle-per-call variants
+SCATTER_MARKERS = 5000
+FILL_SCATTER_MAX_RADIUS = 8  # fill_circles broadcasts disks up to this radius
+OFFSET_CACHE_SIZE = 1024  # radii kept per algorithm in the offset cache
 # -------------------------
 
 
@@ -69,12 +88,424 @@ def bresenham_circle(surface, xc, yc, r, color):
         plot_circle_points(surface, xc, yc, x, y, color)
 
 
-def run_benchmark():
+@lru_cache(maxsize=OFFSET_CACHE_SIZE)
+def octant_steps(r, algorithm="midpoint"):
+    """(x, y) steps of one octant, exactly as the decision loop visits them"""
+    x, y = 0, r
+    xs, ys = [x], [y]
+    if algorithm == "midpoint":
+        p = 1 - r
+        while x < y:
+            x += 1
+            if p < 0:
+                p += 2 * x + 1
+            else:
+                y -= 1
+                p += 2 * (x - y) + 1
+            xs.append(x)
+            ys.append(y)
+    else:
+        d = 3 - 2 * r
+        while x <= y:
+            x += 1
+            if d < 0:
+                d += 4 * x + 6
+            else:
+                y -= 1
+                d += 4 * (x - y) + 10
+            xs.append(x)
+            ys.append(y)
+    steps = np.array([xs, ys], dtype=np.int32)
+    steps.setflags(write=False)
+    return steps
+
+
+@lru_cache(maxsize=OFFSET_CACHE_SIZE)
+def circle_offsets(r, algorithm="midpoint"):
+    """All 8-way symmetric outline offsets of a circle, duplicates removed"""
+    x, y = octant_steps(r, algorithm)
+    offsets = np.concatenate([
+        np.stack([sx * a, sy * b], axis=1)
+        for a, b in ((x, y), (y, x))
+        for sx in (1, -1)
+        for sy in (1, -1)
+    ])
+    offsets = np.unique(offsets, axis=0)
+    offsets.setflags(write=False)
+    return offsets
+
+
+def pixel_buffer(buffer, color):
+    """2D pixel array and raw pixel value for a Surface or an existing array.
+
+    For a Surface the array is a locked surfarray view; drop it when done.
+    An ndarray buffer is used as-is, with `color` as the raw value.
+    """
+    if isinstance(buffer, pygame.Surface):
+        return pygame.surfarray.pixels2d(buffer), buffer.map_rgb(color)
+    return buffer, color
+
+
+def scatter(pixels, points, value):
+    """Write value at (N, 2) points, clipped with a single boolean mask"""
+    width, height = pixels.shape
+    keep = (points[:, 0] >= 0) & (points[:, 0] < width) & (points[:, 1] >= 0) & (points[:, 1] < height)
+    points = points[keep]
+    pixels[points[:, 0], points[:, 1]] = value
+    return len(points)
+
+
+def draw_circles(buffer, centers, radii, color, algorithm="midpoint"):
+    """Rasterize many circle outlines in one call.
+
+    Circles are grouped by radius and each group's cached offsets are
+    broadcast against its centers, so Python only loops over distinct
+    radii. Returns the number of pixels written.
+    """
+    centers = np.asarray(centers, dtype=np.int32).reshape(-1, 2)
+    radii = np.broadcast_to(np.asarray(radii, dtype=np.int32), len(centers))
+    pixels, value = pixel_buffer(buffer, color)
+    width, height = pixels.shape
+
+    # Drop circles whose bounding box misses the buffer entirely
+    ext = np.maximum(radii, 1)
+    visible = ((centers[:, 0] + ext >= 0) & (centers[:, 0] - ext < width) &
+               (centers[:, 1] + ext >= 0) & (centers[:, 1] - ext < height))
+    centers, radii = centers[visible], radii[visible]
+
+    written = 0
+    unique_radii, groups = np.unique(radii, return_inverse=True)
+    for g, r in enumerate(unique_radii.tolist()):
+        offsets = circle_offsets(r, algorithm)
+        points = (centers[groups == g][:, None, :] + offsets[None, :, :]).reshape(-1, 2)
+        written += scatter(pixels, points, value)
+    del pixels
+    return written
+
+
+def draw_circle_cached(surface, xc, yc, r, color, algorithm="midpoint"):
+    """Draw a circle from its cached offsets, culled against the clip rect.
+
+    The bounding box is tested first: fully outside draws nothing, fully
+    inside is one unmasked scatter. When the circle only partly overlaps,
+    only the visible index range of each octant is written. Each range is
+    found by binary search, so a huge circle with a small visible arc costs
+    O(log r + visible pixels). Returns the number of pixels written.
+    """
+    clip = surface.get_clip()
+    ext = max(r, 1)  # Bresenham's r=0 case steps one pixel out
+    if (xc + ext < clip.left or xc - ext >= clip.right or
+            yc + ext < clip.top or yc - ext >= clip.bottom):
+        return 0
+
+    pixels, value = pixel_buffer(surface, color)
+    if (xc - ext >= clip.left and xc + ext < clip.right and
+            yc - ext >= clip.top and yc + ext < clip.bottom):
+        offsets = circle_offsets(r, algorithm)
+        pixels[offsets[:, 0] + xc, offsets[:, 1] + yc] = value
+        del pixels
+        return len(offsets)
+
+    x, y = octant_steps(r, algorithm)
+    xs, ys = [], []
+    for a, b, a_is_x in ((x, y, True), (y, x, False)):
+        for sx in (1, -1):
+            for sy in (1, -1):
+                i0, i1 = _visible_range(a_is_x, sx, xc, clip.left, clip.right, r, algorithm)
+                j0, j1 = _visible_range(not a_is_x, sy, yc, clip.top, clip.bottom, r, algorithm)
+                i0, i1 = max(i0, j0), min(i1, j1)
+                if i0 < i1:
+                    xs.append(xc + sx * a[i0:i1])
+                    ys.append(yc + sy * b[i0:i1])
+    written = 0
+    if xs:
+        xs, ys = np.concatenate(xs), np.concatenate(ys)
+        pixels[xs, ys] = value
+        written = len(xs)
+    del pixels
+    return written
+
+
+@lru_cache(maxsize=OFFSET_CACHE_SIZE)
+def _ascending_octant(r, algorithm):
+    """Octant x steps and negated y steps, both ascending for searchsorted"""
+    x, y = octant_steps(r, algorithm)
+    return x, -y
+
+
+def _visible_range(use_x, sign, center, lo, hi, r, algorithm):
+    """Index range of octant steps with lo <= center + sign * step < hi.
+
+    `use_x` picks the x steps (ascending); otherwise the y steps are used
+    through their ascending negation.
+    """
+    x, neg_y = _ascending_octant(r, algorithm)
+    asc, sign = (x, sign) if use_x else (neg_y, -sign)
+    if sign > 0:
+        return (int(np.searchsorted(asc, lo - center, "left")),
+                int(np.searchsorted(asc, hi - center, "left")))
+    return (int(np.searchsorted(asc, center - hi, "right")),
+            int(np.searchsorted(asc, center - lo, "right")))
+
+
+@lru_cache(maxsize=OFFSET_CACHE_SIZE)
+def disk_half_widths(r, algorithm="midpoint"):
+    """Half span width of a filled disk for every row offset 0..r.
+
+    Taken from the decision loop's octant steps: a step (x, y) bounds rows
+    y and x (by symmetry) at half widths x and y respectively, so the fill
+    meets the outline of the same algorithm exactly.
+    """
+    x, y = octant_steps(r, algorithm)
+    half = np.full(r + 1, -1, dtype=np.int32)
+    keep_x, keep_y = x <= r, y <= r
+    np.maximum.at(half, y[keep_y], x[keep_y])
+    np.maximum.at(half, x[keep_x], y[keep_x])
+    half.setflags(write=False)
+    return half
+
+
+def fill_circle(surface, xc, yc, r, color, algorithm="midpoint"):
+    """Filled disk written as one array slice per scanline"""
+    half = disk_half_widths(r, algorithm)
+    clip = surface.get_clip()
+    pixels, value = pixel_buffer(surface, color)
+    for dy in range(-r, r + 1):
+        y = yc + dy
+        if not clip.top <= y < clip.bottom:
+            continue
+        w = int(half[abs(dy)])
+        left, right = max(xc - w, clip.left), min(xc + w, clip.right - 1)
+        if left <= right:
+            pixels[left:right + 1, y] = value
+    del pixels
+
+
+def fill_circles(buffer, centers, radii, color, algorithm="midpoint"):
+    """Filled disks in bulk, grouped by radius.
+
+    Small radii (scatter-plot markers) are broadcast over the whole group
+    with one scatter per scanline offset. Larger disks write one array
+    slice per scanline each, so Python work follows the scanline count,
+    not the filled area. Returns the number of pixels written.
+    """
+    centers = np.asarray(centers, dtype=np.int32).reshape(-1, 2)
+    radii = np.broadcast_to(np.asarray(radii, dtype=np.int32), len(centers))
+    pixels, value = pixel_buffer(buffer, color)
+    width, height = pixels.shape
+    written = 0
+    unique_radii, groups = np.unique(radii, return_inverse=True)
+    for g, r in enumerate(unique_radii.tolist()):
+        group = centers[groups == g]
+        half = disk_half_widths(r, algorithm)
+        if r <= FILL_SCATTER_MAX_RADIUS:
+            for dy in range(-r, r + 1):
+                w = int(half[abs(dy)])
+                span = np.arange(-w, w + 1, dtype=np.int32)
+                xs = (group[:, 0:1] + span).ravel()
+                ys = np.repeat(group[:, 1] + dy, len(span))
+                written += scatter(pixels, np.stack([xs, ys], axis=1), value)
+            continue
+        half = half.tolist()
+        for xc, yc in group.tolist():
+            for dy in range(max(-r, -yc), min(r, height - 1 - yc) + 1):
+                w = half[abs(dy)]
+                left, right = max(xc - w, 0), min(xc + w, width - 1)
+                if left <= right:
+                    pixels[left:right + 1, yc + dy] = value
+                    written += right - left + 1
+    del pixels
+    return written
+
+
+def ellipse_quadrant(rx, ry):
+    """Midpoint ellipse steps (x, y) for one quadrant, two decision regions.
+
+    Decision variables are kept multiplied by 4 so everything stays integer.
+    Region 1 steps x while the slope is shallower than -1, region 2 steps y.
+    A flat ellipse (ry == 0) is the segment along the x axis; rx == 0 needs
+    no special case since region 2 already walks the y axis.
+    """
+    if ry == 0:
+        for x in range(rx + 1):
+            yield x, 0
+        return
+
+    rx2, ry2 = rx * rx, ry * ry
+    x, y = 0, ry
+    dx, dy = 0, 2 * rx2 * y
+    yield x, y
+
+    # Region 1: p = ry^2 - rx^2*ry + rx^2/4
+    p = 4 * ry2 - 4 * rx2 * ry + rx2
+    while dx < dy:
+        x += 1
+        dx += 2 * ry2
+        if p < 0:
+            p += 4 * (dx + ry2)
+        else:
+            y -= 1
+            dy -= 2 * rx2
+            p += 4 * (dx - dy + ry2)
+        yield x, y
+
+    # Region 2: p = ry^2*(x + 1/2)^2 + rx^2*(y - 1)^2 - rx^2*ry^2
+    p = ry2 * (2 * x + 1) ** 2 + 4 * rx2 * (y - 1) ** 2 - 4 * rx2 * ry2
+    while y > 0:
+        y -= 1
+        dy -= 2 * rx2
+        if p > 0:
+            p += 4 * (rx2 - dy)
+        else:
+            x += 1
+            dx += 2 * ry2
+            p += 4 * (dx - dy + rx2)
+        yield x, y
+
+
+def plot_ellipse_points(surface, xc, yc, x, y, color):
+    """Plot 4 symmetrical points of an ellipse"""
+    for px, py in ((xc + x, yc + y), (xc - x, yc + y), (xc + x, yc - y), (xc - x, yc - y)):
+        if 0 <= px < surface.get_width() and 0 <= py < surface.get_height():
+            surface.set_at((int(px), int(py)), color)
+
+
+def midpoint_ellipse(surface, xc, yc, rx, ry, color):
+    """Midpoint Ellipse Drawing Algorithm"""
+    for x, y in ellipse_quadrant(rx, ry):
+        plot_ellipse_points(surface, xc, yc, x, y, color)
+
+
+@lru_cache(maxsize=OFFSET_CACHE_SIZE)
+def ellipse_offsets(rx, ry):
+    """All 4-way symmetric outline offsets of an ellipse, duplicates removed"""
+    x, y = np.array(list(ellipse_quadrant(rx, ry)), dtype=np.int32).T
+    offsets = np.concatenate([np.stack([sx * x, sy * y], axis=1) for sx in (1, -1) for sy in (1, -1)])
+    offsets = np.unique(offsets, axis=0)
+    offsets.setflags(write=False)
+    return offsets
+
+
+def draw_ellipses(buffer, centers, axes, color):
+    """Rasterize many axis-aligned ellipses, grouped by their (rx, ry) pair.
+
+    Returns the number of pixels written.
+    """
+    centers = np.asarray(centers, dtype=np.int32).reshape(-1, 2)
+    axes = np.broadcast_to(np.asarray(axes, dtype=np.int32).reshape(-1, 2), centers.shape)
+    pixels, value = pixel_buffer(buffer, color)
+    width, height = pixels.shape
+
+    visible = ((centers[:, 0] + axes[:, 0] >= 0) & (centers[:, 0] - axes[:, 0] < width) &
+               (centers[:, 1] + axes[:, 1] >= 0) & (centers[:, 1] - axes[:, 1] < height))
+    centers, axes = centers[visible], axes[visible]
+
+    written = 0
+    if len(axes):
+        unique_axes, groups = np.unique(axes, axis=0, return_inverse=True)
+        for g, (rx, ry) in enumerate(unique_axes.tolist()):
+            offsets = ellipse_offsets(rx, ry)
+            points = (centers[groups.ravel() == g][:, None, :] + offsets[None, :, :]).reshape(-1, 2)
+            written += scatter(pixels, points, value)
+    del pixels
+    return written
+
+
+def parametric_ellipse(surface, xc, yc, rx, ry, color, samples=None):
+    """Sampled parametric ellipse; by default uses the midpoint pixel budget"""
+    if samples is None:
+        samples = len(ellipse_offsets(rx, ry))
+    t = np.linspace(0.0, 2.0 * np.pi, samples, endpoint=False)
+    points = np.stack([np.rint(xc + rx * np.cos(t)), np.rint(yc + ry * np.sin(t))], axis=1).astype(np.int32)
+    pixels, value = pixel_buffer(surface, color)
+    written = scatter(pixels, points, value)
+    del pixels
+    return written
+
+
+@lru_cache(maxsize=OFFSET_CACHE_SIZE)
+def aa_circle_pattern(r):
+    """Wu-style anti-aliased circle: offsets and coverage weights for radius r.
+
+    For each x of one octant the exact y = sqrt(r^2 - x^2) is split between
+    the two pixels it falls between. The octant is mirrored 8 ways, and
+    pixels hit twice (axes, diagonal) keep their larger weight.
+    """
+    x = np.arange(0, int(np.ceil(r / np.sqrt(2.0))) + 1)
+    y = np.sqrt(np.maximum(r * r - x * x, 0))
+    yi = np.floor(y).astype(np.int64)
+    frac = y - yi
+    a = np.concatenate([x, x])
+    b = np.concatenate([yi, yi + 1])
+    w = np.concatenate([1.0 - frac, frac])
+
+    offsets = np.concatenate([
+        np.stack([sx * p, sy * q], axis=1)
+        for p, q in ((a, b), (b, a))
+        for sx in (1, -1)
+        for sy in (1, -1)
+    ])
+    weights = np.tile(w, 8)
+    keep = weights > 0
+    offsets, weights = offsets[keep], weights[keep]
+
+    # Merge duplicates, keeping the strongest coverage
+    offsets, inverse = np.unique(offsets, axis=0, return_inverse=True)
+    merged = np.zeros(len(offsets))
+    np.maximum.at(merged, inverse.ravel(), weights)
+    offsets = offsets.astype(np.int32)
+    offsets.setflags(write=False)
+    merged.setflags(write=False)
+    return offsets, merged
+
+
+def draw_circles_aa(coverage, centers, radii):
+    """Accumulate anti-aliased circles into a float coverage buffer (x, y)"""
+    centers = np.asarray(centers, dtype=np.int64).reshape(-1, 2)
+    radii = np.broadcast_to(np.asarray(radii, dtype=np.int64), len(centers))
+    width, height = coverage.shape
+    flat, weights = [], []
+    unique_radii, groups = np.unique(radii, return_inverse=True)
+    for g, r in enumerate(unique_radii.tolist()):
+        offsets, w = aa_circle_pattern(r)
+        group = centers[groups.ravel() == g]
+        xs = (group[:, 0:1] + offsets[:, 0]).ravel()
+        ys = (group[:, 1:2] + offsets[:, 1]).ravel()
+        ws = np.tile(w, len(group))
+        keep = (xs >= 0) & (xs < width) & (ys >= 0) & (ys < height)
+        flat.append(xs[keep] * height + ys[keep])
+        weights.append(ws[keep])
+    if flat:
+        coverage += np.bincount(np.concatenate(flat), weights=np.concatenate(weights),
+                                minlength=width * height).reshape(width, height)
+
+
+def resolve_coverage(surface, coverage, color):
+    """Blend a coverage buffer into the surface in one pass, then clear it"""
+    alpha = np.clip(coverage, 0.0, 1.0)[..., None]
+    pixels = pygame.surfarray.pixels3d(surface)
+    blended = pixels * (1.0 - alpha) + np.asarray(color, dtype=np.float64) * alpha
+    pixels[...] = (blended + 0.5).astype(np.uint8)
+    del pixels
+    coverage.fill(0.0)
+
+
+def random_markers(count, rng=random):
+    """Random scatter-plot style markers inside DRAW_AREA"""
+    centers = [(rng.randint(0, DRAW_AREA[0]-1), rng.randint(0, DRAW_AREA[1]-1)) for _ in range(count)]
+    radii = [rng.randint(2, 8) for _ in range(count)]
+    return centers, radii
+
+
+def run_benchmark(mode="circles"):
     """Benchmark both algorithms with random circles"""
     surf = pygame.Surface(DRAW_AREA)
-    circles = [(random.randint(50, DRAW_AREA[0]-50), 
-                random.randint(50, DRAW_AREA[1]-50),
-                random.randint(20, 100))
+    if mode == "ellipses":
+        return run_ellipse_benchmark(surf)
+    rng = random.Random(BENCH_SEED)
+    circles = [(rng.randint(50, DRAW_AREA[0]-50), 
+                rng.randint(50, DRAW_AREA[1]-50),
+                rng.randint(20, 100))
                for _ in range(BENCH_CIRCLES)]
 
     # Midpoint
@@ -89,7 +520,151 @@ def run_benchmark():
         bresenham_circle(surf, xc, yc, r, (1, 1, 1))
     bres_time = time.perf_counter() - t0
 
-    return midpoint_time, bres_time
+    # Cached offsets (midpoint), radii 20-100 are all hits after warm-up
+    t0 = time.perf_counter()
+    for (xc, yc, r) in circles:
+        draw_circle_cached(surf, xc, yc, r, (1, 1, 1))
+    cached_time = time.perf_counter() - t0
+
+    # Whole batch in one call, grouped by radius
+    t0 = time.perf_counter()
+    draw_circles(surf, [c[:2] for c in circles], [c[2] for c in circles], (1, 1, 1))
+    batch_time = time.perf_counter() - t0
+
+    # Filled disks, span per scanline
+    t0 = time.perf_counter()
+    fill_circles(surf, [c[:2] for c in circles], [c[2] for c in circles], (1, 1, 1))
+    fill_time = time.perf_counter() - t0
+
+    return [("Midpoint", midpoint_time, MIDPOINT_COLOR),
+            ("Bresenham", bres_time, BRES_COLOR),
+            ("Cached", cached_time, CACHED_COLOR),
+            ("Batch", batch_time, CACHED_COLOR),
+            ("Filled", fill_time, FILL_COLOR)]
+
+
+def run_ellipse_benchmark(surf):
+    """Midpoint ellipse vs a parametric ellipse sampled at the same pixel budget"""
+    rng = random.Random(BENCH_SEED)
+    ellipses = [(rng.randint(50, DRAW_AREA[0]-50),
+                 rng.randint(50, DRAW_AREA[1]-50),
+                 rng.randint(20, 100), rng.randint(20, 100))
+                for _ in range(BENCH_CIRCLES)]
+
+    t0 = time.perf_counter()
+    for (xc, yc, rx, ry) in ellipses:
+        midpoint_ellipse(surf, xc, yc, rx, ry, (1, 1, 1))
+    midpoint_time = time.perf_counter() - t0
+
+    # Batched scatter, timed with the offset cache already warm
+    centers, axes = [e[:2] for e in ellipses], [e[2:] for e in ellipses]
+    draw_ellipses(surf, centers, axes, (1, 1, 1))
+    t0 = time.perf_counter()
+    draw_ellipses(surf, centers, axes, (1, 1, 1))
+    batch_time = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    for (xc, yc, rx, ry) in ellipses:
+        parametric_ellipse(surf, xc, yc, rx, ry, (1, 1, 1))
+    param_time = time.perf_counter() - t0
+
+    # Share of the midpoint outline the parametric samples actually reach
+    hit = total = 0
+    for (_, _, rx, ry) in ellipses[:100]:
+        outline = ellipse_offsets(rx, ry)
+        canvas = np.zeros((2 * rx + 1, 2 * ry + 1), dtype=np.uint32)
+        parametric_ellipse(canvas, rx, ry, rx, ry, 1)
+        hit += int(canvas[outline[:, 0] + rx, outline[:, 1] + ry].sum())
+        total += len(outline)
+
+    return [("Ellipse", midpoint_time, ELLIPSE_COLOR),
+            ("Ell cached", batch_time, ELLIPSE_COLOR),
+            (f"Param {hit / total:.0%}", param_time, PARAM_COLOR)]
+
+
+def sweep_benchmark(count=SWEEP_CIRCLES, repeats=BENCH_REPEATS, seed=BENCH_SEED, buckets=SWEEP_BUCKETS,
+                    group=SWEEP_GROUP):
+    """Headless, seeded benchmark of every circle variant per radius bucket.
+
+    Each bucket draws `count` circles with radii in [lo, hi] and centers
+    anywhere in DRAW_AREA, once untimed to warm the offset caches and then
+    `repeats` timed passes. Variants that draw one circle per call are timed
+    in groups of `group` circles, so their µs-per-circle percentiles cover
+    repeats * count / group samples. The batch variant draws the whole
+    bucket in one call, as it would be used, so its samples are whole passes.
+    Pixels per second counts the pixels actually written (clipped to the
+    surface). Returns a dict ready for json.dump.
+    """
+    rng = random.Random(seed)
+    surf = pygame.Surface(DRAW_AREA)
+    color = (1, 1, 1)
+    width, height = DRAW_AREA
+
+    def per_circle(draw):
+        def run(circles):
+            for (xc, yc, r) in circles:
+                draw(surf, xc, yc, r, color)
+        return run
+
+    def batched(circles):
+        draw_circles(surf, [c[:2] for c in circles], [c[2] for c in circles], color)
+
+    def written(circles, algorithm):
+        total = 0
+        for (xc, yc, r) in circles:
+            points = circle_offsets(r, algorithm) + (xc, yc)
+            total += int(((points[:, 0] >= 0) & (points[:, 0] < width) &
+                          (points[:, 1] >= 0) & (points[:, 1] < height)).sum())
+        return total
+
+    # (name, run, offsets algorithm, circles per timed sample)
+    variants = [
+        ("midpoint", per_circle(midpoint_circle), "midpoint", group),
+        ("bresenham", per_circle(bresenham_circle), "bresenham", group),
+        ("cached", per_circle(draw_circle_cached), "midpoint", group),
+        ("batch", batched, "midpoint", count),
+    ]
+
+    results = []
+    for lo, hi in buckets:
+        circles = [(rng.randint(0, width - 1), rng.randint(0, height - 1), rng.randint(lo, hi))
+                   for _ in range(count)]
+        for name, run, algorithm, size in variants:
+            pixels = written(circles, algorithm)
+            chunks = [circles[i:i + size] for i in range(0, count, size)]
+            run(circles)
+            samples, passes = [], []
+            for _ in range(repeats):
+                total = 0.0
+                for chunk in chunks:
+                    t0 = time.perf_counter()
+                    run(chunk)
+                    elapsed = time.perf_counter() - t0
+                    samples.append(elapsed / len(chunk))
+                    total += elapsed
+                passes.append(total)
+            us = np.array(samples) * 1e6
+            results.append({
+                "bucket": [lo, hi],
+                "variant": name,
+                "circles_per_sample": size,
+                "us_per_circle": {
+                    "min": float(us.min()),
+                    "p50": float(np.percentile(us, 50)),
+                    "p90": float(np.percentile(us, 90)),
+                    "p99": float(np.percentile(us, 99)),
+                    "samples": len(us),
+                },
+                "pixels_per_sec": pixels / float(np.median(passes)),
+            })
+
+    return {
+        "seed": seed,
+        "circles_per_bucket": count,
+        "repeats": repeats,
+        "surface": list(DRAW_AREA),
+        "results": results,
+    }
 
 
 def draw_panel(screen, font, small_font, center, radius, bench_result):
@@ -112,12 +687,14 @@ def draw_panel(screen, font, small_font, center, radius, bench_result):
         "Mouse wheel: ±5 radius",
         "Shift+wheel: ±1 radius",
         "UP/DOWN: ±5, Shift: ±1",
-        "",
         "M - Draw Midpoint (cyan)",
         "B - Draw Bresenham (red)",
         "A - Draw Both (overlapped)",
+        "K/F - Cached outline / Fill",
+        "R - Scatter markers (batch)",
+        "E/W - Ellipse / Anti-aliased",
         "C - Clear screen",
-        "S - Run Benchmark"
+        "S/L - Circle/Ellipse Benchmark"
     ]
     for line in instructions:
         txt = small_font.render(line, True, TEXT_COLOR)
@@ -128,30 +705,19 @@ def draw_panel(screen, font, small_font, center, radius, bench_result):
     if center:
         y += 10
         screen.blit(font.render("Circle Parameters:", True, ACCENT_COLOR), (panel_x + 20, y))
-        y += 35
-        txt = small_font.render(f"Center: {center}", True, TEXT_COLOR)
-        screen.blit(txt, (panel_x + 20, y))
-        y += 25
-        txt = small_font.render(f"Radius: {radius}", True, TEXT_COLOR)
+        y += 30
+        txt = small_font.render(f"Center: {center}  r={radius}", True, TEXT_COLOR)
         screen.blit(txt, (panel_x + 20, y))
 
     # Benchmark results
     if bench_result:
-        mid_time, bres_time = bench_result
         y += 30
         screen.blit(font.render("Benchmark:", True, ACCENT_COLOR), (panel_x + 20, y))
-        y += 40
-        screen.blit(small_font.render(
-            f"Midpoint: {mid_time:.5f} s", True, MIDPOINT_COLOR), (panel_x + 20, y))
-        y += 25
-        screen.blit(small_font.render(
-            f"({mid_time/BENCH_CIRCLES*1e6:.2f} µs/circle)", True, MIDPOINT_COLOR), (panel_x + 20, y))
-        y += 35
-        screen.blit(small_font.render(
-            f"Bresenham: {bres_time:.5f} s", True, BRES_COLOR), (panel_x + 20, y))
-        y += 25
-        screen.blit(small_font.render(
-            f"({bres_time/BENCH_CIRCLES*1e6:.2f} µs/circle)", True, BRES_COLOR), (panel_x + 20, y))
+        y += 30
+        for label, seconds, color in bench_result:
+            screen.blit(small_font.render(
+                f"{label}: {seconds/BENCH_CIRCLES*1e6:.2f} µs/shape", True, color), (panel_x + 20, y))
+            y += 20
 
 
 def main():
@@ -164,6 +730,7 @@ def main():
 
     draw_surface = pygame.Surface(DRAW_AREA)
     draw_surface.fill(BG_COLOR)
+    coverage = np.zeros(DRAW_AREA, dtype=np.float32)
 
     center = None
     radius = 50
@@ -215,12 +782,31 @@ def main():
                 elif ev.key == pygame.K_b and center:
                     bresenham_circle(draw_surface, center[0], center[1], radius, BRES_COLOR)
                 
+                elif ev.key == pygame.K_k and center:
+                    draw_circle_cached(draw_surface, center[0], center[1], radius, CACHED_COLOR)
+                
+                elif ev.key == pygame.K_f and center:
+                    fill_circle(draw_surface, center[0], center[1], radius, FILL_COLOR)
+                
+                elif ev.key == pygame.K_e and center:
+                    midpoint_ellipse(draw_surface, center[0], center[1], radius, max(radius // 2, 1), ELLIPSE_COLOR)
+                
+                elif ev.key == pygame.K_w and center:
+                    draw_circles_aa(coverage, [center], [radius])
+                    resolve_coverage(draw_surface, coverage, AA_COLOR)
+                
+                elif ev.key == pygame.K_r:
+                    draw_circles(draw_surface, *random_markers(SCATTER_MARKERS), CACHED_COLOR)
+                
                 elif ev.key == pygame.K_a and center:
                     midpoint_circle(draw_surface, center[0], center[1], radius, MIDPOINT_COLOR)
                     bresenham_circle(draw_surface, center[0], center[1], radius, BRES_COLOR)
                 
                 elif ev.key == pygame.K_s:
                     bench_result = run_benchmark()
+                
+                elif ev.key == pygame.K_l:
+                    bench_result = run_benchmark("ellipses")
 
         screen.blit(draw_surface, (0, 0))
         draw_panel(screen, font, small_font, center, radius, bench_result)
@@ -232,5 +818,25 @@ def main():
     sys.exit()
 
 
+def parse_args():
+    parser = argparse.ArgumentParser(description="Midpoint vs Bresenham circle drawing")
+    parser.add_argument("--bench", action="store_true", help="run the headless radius-sweep benchmark")
+    parser.add_argument("--count", type=int, default=SWEEP_CIRCLES, help="circles per radius bucket")
+    parser.add_argument("--repeats", type=int, default=BENCH_REPEATS, help="timed passes per variant")
+    parser.add_argument("--group", type=int, default=SWEEP_GROUP, help="circles per timed sample (per-circle variants)")
+    parser.add_argument("--seed", type=int, default=BENCH_SEED)
+    parser.add_argument("--out", help="write the JSON report here instead of stdout")
+    return parser.parse_args()
+
+
 if __name__ == "__main__":
+    args = parse_args()
+    if args.bench:
+        report = sweep_benchmark(args.count, args.repeats, args.seed, group=args.group)
+        if args.out:
+            with open(args.out, "w") as f:
+                json.dump(report, f, indent=2)
+        else:
+            print(json.dumps(report, indent=2))
+        sys.exit(0)
     main()
\ No newline at end of file
@@ -1,7 +1,18 @@
+import os
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")  # keep --bench output clean
 import pygame
 import sys
 import time
+import csv
+import math
+import json
+import random
+import argparse
+import bisect
+import tracemalloc
+import numpy as np
 from collections import deque
+from multiprocessing import Pool, shared_memory
 
 # -------- Config --------
 WIDTH, HEIGHT = 1100, 650
@@ -18,219 +29,946 @@ FLOOD4_COLOR = (100, 150, 255)        # Blue
 FLOOD8_COLOR = (255, 100, 255)        # Magenta
 BOUNDARY_FILL_COLOR = (255, 200, 100) # Orange
 BOUNDARY_OUTLINE = (255, 50, 50)      # Red
+SPAN_FILL_COLOR = (80, 230, 230)      # Cyan
+PATH_FILL_COLOR = (180, 140, 255)     # Lavender
+TRIANGLE_COLOR = (240, 120, 120)      # Salmon
+MESH_COLOR = (120, 50, 50)
 
 TEXT_COLOR = (230, 230, 230)
 ACCENT_COLOR = (180, 180, 180)
 VERTEX_COLOR = (255, 255, 100)
+VERTEX_RADIUS = 4
+OUTLINE_THICKNESS = 2
+BAND_ROWS = 512  # rows a parallel-fill worker expands at once
+MONOTONE_MIN_VERTICES = 64  # above this, triangulate by monotone partition
+MESH_EXPORT_PATH = "polygon_mesh.json"
+TEXT_CACHE_SIZE = 256  # rendered panel strings kept between frames
+
+BENCH_SEED = 0
+BENCH_REPEATS = 3
+BENCH_KINDS = ("convex", "star", "spiral", "comb")
+BENCH_VERTICES = (8, 64, 256)
+BENCH_RADII = (60, 180)  # half the bounding-box side, controls the area
+REDRAW_PAD = OUTLINE_THICKNESS + VERTEX_RADIUS + 1  # pixels an edit smears past its edges
 # -------------------------
 
 
-def draw_line_bresenham(surface, x0, y0, x1, y1, color):
-    """Draw a line using Bresenham's algorithm"""
-    dx = abs(x1 - x0)
-    dy = abs(y1 - y0)
-    sx = 1 if x0 < x1 else -1
-    sy = 1 if y0 < y1 else -1
-    err = dx - dy
-    
-    while True:
-        if 0 <= x0 < surface.get_width() and 0 <= y0 < surface.get_height():
-            surface.set_at((x0, y0), color)
-        
-        if x0 == x1 and y0 == y1:
-            break
-        
-        e2 = 2 * err
-        if e2 > -dy:
-            err -= dy
-            x0 += sx
-        if e2 < dx:
-            err += dx
-            y0 += sy
+def draw_thick_line(surface, x0, y0, x1, y1, color, width=5):
+    """Thick line with round caps, rasterized as one horizontal span per row.
+
+    The stroke is every point within width/2 of the segment (a capsule).
+    That shape is convex, so each scanline crosses it in a single interval:
+    the union of the body's interval and the two end disks' intervals.
+    Spans are written as array slices, O(length * width) pixels in one
+    pass, and the surface clip rect is respected. Returns pixels written.
+    """
+    h = width / 2.0
+    length = math.hypot(x1 - x0, y1 - y0)
+    clip = surface.get_clip()
+    y_lo = max(math.ceil(min(y0, y1) - h), clip.top)
+    y_hi = min(math.floor(max(y0, y1) + h), clip.bottom - 1)
+    if y_lo > y_hi:
+        return 0
+    ys = np.arange(y_lo, y_hi + 1, dtype=np.float64)
+
+    lefts = np.full(ys.shape, np.inf)
+    rights = np.full(ys.shape, -np.inf)
+
+    # End disks
+    for cx, cy in ((x0, y0), (x1, y1)):
+        r2 = h * h - (ys - cy) ** 2
+        inside = r2 >= 0
+        half = np.sqrt(np.where(inside, r2, 0.0))
+        lefts = np.where(inside, np.minimum(lefts, cx - half), lefts)
+        rights = np.where(inside, np.maximum(rights, cx + half), rights)
 
+    # Body: 0 <= along <= length and |across| <= h, each linear in x per row
+    if length > 0:
+        ux, uy = (x1 - x0) / length, (y1 - y0) / length
+        lo, hi = np.full(ys.shape, -np.inf), np.full(ys.shape, np.inf)
+        for c, d, a, b in ((ux, uy, 0.0, length), (-uy, ux, -h, h)):
+            t = d * (ys - y0)
+            if abs(c) > 1e-12:
+                e0, e1 = x0 + (a - t) / c, x0 + (b - t) / c
+                lo, hi = np.maximum(lo, np.minimum(e0, e1)), np.minimum(hi, np.maximum(e0, e1))
+            else:
+                empty = (t < a) | (t > b)
+                lo, hi = np.where(empty, np.inf, lo), np.where(empty, -np.inf, hi)
+        body = lo <= hi
+        lefts = np.where(body, np.minimum(lefts, lo), lefts)
+        rights = np.where(body, np.maximum(rights, hi), rights)
 
-def scanline_fill(surface, polygon, fill_color):
-    """Scanline Fill Algorithm"""
+    rows = np.isfinite(lefts)
+    lefts = np.maximum(np.ceil(lefts[rows] - 1e-9), clip.left).astype(int)
+    rights = np.minimum(np.floor(rights[rows] + 1e-9), clip.right - 1).astype(int)
+    ys = ys[rows].astype(int)
+
+    value = surface.map_rgb(color)
+    pixels = pygame.surfarray.pixels2d(surface)
+    written = 0
+    for y, left, right in zip(ys.tolist(), lefts.tolist(), rights.tolist()):
+        if left <= right:
+            pixels[left:right + 1, y] = value
+            written += right - left + 1
+    del pixels
+    return written
+
+
+def build_edge_table(polygon):
+    """Edge table for scanline filling, bucketed by each edge's ymin.
+
+    Every non-horizontal edge becomes [ymax, x, rem, step, rem_step, dy],
+    with x + rem/dy being the exact intersection at the current scanline.
+    Advancing one scanline adds step + rem_step/dy using integers only, so
+    x never drifts.
+    """
+    table = {}
+    n = len(polygon)
+    for i in range(n):
+        x1, y1 = polygon[i]
+        x2, y2 = polygon[(i + 1) % n]
+        if y1 == y2:  # Horizontal edge
+            continue
+        if y1 > y2:
+            x1, y1, x2, y2 = x2, y2, x1, y1
+        dy = y2 - y1
+        step, rem_step = divmod(x2 - x1, dy)
+        table.setdefault(y1, []).append([y2, x1, 0, step, rem_step, dy])
+    return table
+
+
+def scanline_fill(surface, polygon, fill_color, stats=None):
+    """Scanline Fill Algorithm (edge table + active edge table)"""
     if len(polygon) < 3:
         return 0
     
+    table = build_edge_table(polygon)
+    if not table:
+        return 0
+    
+    width, height = surface.get_size()
+    value = surface.map_rgb(fill_color)
+    pixels = pygame.surfarray.pixels2d(surface)
     pixels_filled = 0
     
-    # Find y bounds
-    min_y = min(p[1] for p in polygon)
-    max_y = max(p[1] for p in polygon)
+    active = []
+    max_active = 0
+    starts = sorted(table)
+    next_start = 0
+    y = starts[0]
+    max_y = max(e[0] for edges in table.values() for e in edges)
     
-    # For each scanline
-    for y in range(min_y, max_y + 1):
-        intersections = []
-        
-        # Find intersections with polygon edges
-        n = len(polygon)
-        for i in range(n):
-            x1, y1 = polygon[i]
-            x2, y2 = polygon[(i + 1) % n]
-            
-            # Check if edge crosses scanline
-            if y1 == y2:  # Horizontal edge
-                continue
-            
-            if min(y1, y2) <= y < max(y1, y2):
-                # Calculate x intersection
-                x = x1 + (y - y1) * (x2 - x1) / (y2 - y1)
-                intersections.append(int(x))
+    while y < max_y:
+        # Edges starting on this scanline join, finished ones leave
+        while next_start < len(starts) and starts[next_start] == y:
+            active.extend(table[starts[next_start]])
+            next_start += 1
+        active = [e for e in active if e[0] > y]
+        max_active = max(max_active, len(active))
+        if not active and next_start < len(starts):
+            y = starts[next_start]
+            continue
         
-        # Sort intersections
-        intersections.sort()
+        # Fill between pairs of sorted intersections
+        if 0 <= y < height:
+            # int() truncation toward zero, as the direct formula did
+            xs = sorted(e[1] + 1 if e[1] < 0 and e[2] else e[1] for e in active)
+            for i in range(0, len(xs) - 1, 2):
+                x_start = max(xs[i], 0)
+                x_end = min(xs[i + 1], width - 1)
+                if x_start <= x_end:
+                    pixels[x_start:x_end + 1, y] = value
+                    pixels_filled += x_end - x_start + 1
         
-        # Fill between pairs
-        for i in range(0, len(intersections) - 1, 2):
-            x_start = intersections[i]
-            x_end = intersections[i + 1]
-            for x in range(x_start, x_end + 1):
-                if 0 <= x < surface.get_width() and 0 <= y < surface.get_height():
-                    surface.set_at((x, y), fill_color)
-                    pixels_filled += 1
+        # Incremental x update for the next scanline
+        for e in active:
+            e[1] += e[3]
+            e[2] += e[4]
+            if e[2] >= e[5]:
+                e[1] += 1
+                e[2] -= e[5]
+        y += 1
     
+    del pixels
+    if stats is not None:
+        stats["max_active"] = max_active
     return pixels_filled
 
 
-def flood_fill_4(surface, x, y, fill_color, target_color):
-    """4-connected Flood Fill using BFS"""
-    if x < 0 or x >= surface.get_width() or y < 0 or y >= surface.get_height():
+def edge_rows(layers):
+    """Flatten the edge tables of (polygon, color) layers into one int array.
+
+    One row per edge: layer, ymin, ymax, x, step, rem_step, dy, taken
+    straight from `build_edge_table`, so workers get the same exact
+    integer stepping as the serial fill.
+    """
+    rows = []
+    for layer, (polygon, _) in enumerate(layers):
+        if len(polygon) < 3:
+            continue
+        for ymin, edges in build_edge_table(polygon).items():
+            for ymax, x, _, step, rem_step, dy in edges:
+                rows.append((layer, ymin, ymax, x, step, rem_step, dy))
+    return np.asarray(rows, dtype=np.int64).reshape(-1, 7)
+
+
+def scanline_band(edges, y_lo, y_hi):
+    """Spans `scanline_fill` would write in rows [y_lo, y_hi), as (ys, x_starts, x_ends).
+
+    Instead of stepping the active edge table down from each edge's ymin,
+    every edge jumps straight to the band: after k scanlines the exact x is
+    x + k*step + (k*rem_step) // dy with remainder (k*rem_step) % dy.
+    Crossings are then sorted per row and paired like the serial AET.
+    """
+    ymin, ymax, x, step, rem_step, dy = edges[:, 1:].T
+    start, stop = np.maximum(ymin, y_lo), np.minimum(ymax, y_hi)
+    counts = np.maximum(stop - start, 0)
+    total = int(counts.sum())
+    idx = np.repeat(np.arange(len(edges)), counts)
+    y = start[idx] + np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+    
+    k = y - ymin[idx]
+    carry, rem = np.divmod(k * rem_step[idx], dy[idx])
+    xs = x[idx] + k * step[idx] + carry
+    # int() truncation toward zero, as in scanline_fill
+    xs = np.where((xs < 0) & (rem != 0), xs + 1, xs)
+    
+    order = np.lexsort((xs, y))
+    y, xs = y[order], xs[order]
+    first = np.searchsorted(y, y, side="left")
+    rank = np.arange(total) - first
+    last = np.searchsorted(y, y, side="right") - first
+    left = np.flatnonzero((rank % 2 == 0) & (rank + 1 < last))
+    return y[left], xs[left], xs[left + 1]
+
+
+def _scanline_band_worker(args):
+    """Fill every layer, in order, into one band of rows of the shared canvas"""
+    edges_name, n_edges, canvas_name, shape, y_lo, y_hi, values = args
+    edges_shm = shared_memory.SharedMemory(name=edges_name)
+    canvas_shm = shared_memory.SharedMemory(name=canvas_name)
+    filled = 0
+    try:
+        edges = np.ndarray((n_edges, 7), dtype=np.int64, buffer=edges_shm.buf)
+        canvas = np.ndarray(shape, dtype=np.uint32, buffer=canvas_shm.buf)
+        width = shape[1]
+        for layer, value in enumerate(values):
+            layer_edges = edges[edges[:, 0] == layer]
+            for lo in range(y_lo, y_hi, BAND_ROWS):
+                ys, x_starts, x_ends = scanline_band(layer_edges, lo, min(lo + BAND_ROWS, y_hi))
+                x_starts, x_ends = np.maximum(x_starts, 0), np.minimum(x_ends, width - 1)
+                keep = x_starts <= x_ends
+                ys, x_starts, x_ends = ys[keep], x_starts[keep], x_ends[keep]
+                filled += int((x_ends - x_starts + 1).sum())
+                for y, x_start, x_end in zip(ys.tolist(), x_starts.tolist(), x_ends.tolist()):
+                    canvas[y, x_start:x_end + 1] = value
+        del edges, canvas, layer_edges
+    finally:
+        edges_shm.close()
+        canvas_shm.close()
+    return filled
+
+
+def scanline_fill_parallel(surface, layers, workers=None):
+    """Scanline-fill (polygon, color) layers with one worker process per band of rows.
+
+    The edge tables are built once and shared; each worker derives its own
+    active edges at the top of its band and writes only its rows of a
+    shared-memory canvas. Layers are painted in order within every band,
+    so the result is identical to calling `scanline_fill` on each layer in
+    turn. Returns the pixel count that those calls would.
+    """
+    workers = workers or os.cpu_count() or 1
+    width, height = surface.get_size()
+    edges = edge_rows(layers)
+    if not len(edges):
+        return 0
+    shape = (height, width)
+    y_lo = max(int(edges[:, 1].min()), 0)
+    y_hi = min(int(edges[:, 2].max()), height)
+    if y_lo >= y_hi:
         return 0
     
-    start_color = surface.get_at((x, y))[:3]
-    if start_color == fill_color or start_color != target_color:
+    edges_shm = shared_memory.SharedMemory(create=True, size=edges.nbytes)
+    canvas_shm = shared_memory.SharedMemory(create=True, size=height * width * 4)
+    try:
+        np.ndarray(edges.shape, dtype=np.int64, buffer=edges_shm.buf)[:] = edges
+        canvas = np.ndarray(shape, dtype=np.uint32, buffer=canvas_shm.buf)
+        pixels = pygame.surfarray.pixels2d(surface)
+        canvas[:] = pixels.T
+        
+        values = [surface.map_rgb(color) for _, color in layers]
+        bounds = np.linspace(y_lo, y_hi, workers + 1).astype(int)
+        jobs = [(edges_shm.name, len(edges), canvas_shm.name, shape,
+                 int(bounds[b]), int(bounds[b + 1]), values)
+                for b in range(workers) if bounds[b] < bounds[b + 1]]
+        # close/join rather than the context manager's terminate(): workers
+        # forked after pygame.init() inherit SDL's SIGTERM handler and hang
+        pool = Pool(len(jobs))
+        try:
+            filled = sum(pool.map(_scanline_band_worker, jobs))
+        finally:
+            pool.close()
+            pool.join()
+        
+        pixels[...] = canvas.T
+        del pixels, canvas
+    finally:
+        edges_shm.close()
+        edges_shm.unlink()
+        canvas_shm.close()
+        canvas_shm.unlink()
+    return filled
+
+
+class VisitMask:
+    """Reusable visited mask for the fill algorithms, one byte per pixel.
+
+    A pixel counts as visited when its stamp equals the current generation,
+    so starting a new fill is just a generation bump. The buffer is only
+    zeroed when the 8-bit generation wraps, once every 255 fills.
+    """
+    
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.stamps = bytearray(width * height)
+        self.generation = 0
+    
+    def begin(self):
+        self.generation += 1
+        if self.generation > 255:
+            self.stamps[:] = bytes(len(self.stamps))
+            self.generation = 1
+        return self.generation
+    
+    @property
+    def nbytes(self):
+        return len(self.stamps)
+
+
+_visit_masks = {}
+
+
+def visit_mask_for(surface):
+    """Shared VisitMask sized to the surface, created on first use"""
+    size = surface.get_size()
+    if size not in _visit_masks:
+        _visit_masks[size] = VisitMask(*size)
+    return _visit_masks[size]
+
+
+def label_runs(inside, connectivity=4):
+    """Connected components of a boolean (rows, cols) mask, one label per run.
+
+    The mask is run-length encoded per row. Runs on neighbouring rows that
+    touch (or touch diagonally for 8-connectivity) are linked, and the links
+    are merged with a vectorized union-find: every root hooks onto the
+    smallest root it is linked to, then paths are compressed by pointer
+    jumping until nothing changes. Returns (rows, starts, ends, roots),
+    with ends inclusive.
+    """
+    height, width = inside.shape
+    edges = np.diff(inside.astype(np.int8), axis=1, prepend=0, append=0)
+    rows, starts = np.nonzero(edges == 1)
+    _, stops = np.nonzero(edges == -1)
+    ends = stops - 1
+    
+    # Global keys keep runs sorted by (row, column) across the whole mask
+    k = width + 2
+    start_keys = rows * k + starts
+    end_keys = rows * k + ends
+    reach = 1 if connectivity == 8 else 0
+    lo = np.searchsorted(end_keys, (rows + 1) * k + starts - reach, "left")
+    hi = np.searchsorted(start_keys, (rows + 1) * k + ends + reach, "right")
+    counts = np.maximum(hi - lo, 0)
+    a = np.repeat(np.arange(len(rows)), counts)
+    b = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts) + lo[a]
+    
+    parent = np.arange(len(rows))
+    while True:
+        ra, rb = parent[a], parent[b]
+        linked = ra != rb
+        if not linked.any():
+            break
+        np.minimum.at(parent, np.maximum(ra, rb)[linked], np.minimum(ra, rb)[linked])
+        while True:
+            jumped = parent[parent]
+            if np.array_equal(jumped, parent):
+                break
+            parent = jumped
+    return rows, starts, ends, parent
+
+
+def pixel_value(surface, x, y):
+    """Mapped 32-bit value of one pixel, read through a pixels2d view"""
+    pixels = pygame.surfarray.pixels2d(surface)
+    value = int(pixels[x, y])
+    del pixels
+    return value
+
+
+def color_match(surface, color, tolerance=0):
+    """(W, H) bool array of the pixels matching `color`.
+
+    Exact matches compare mapped 32-bit ints on a pixels2d view. With a
+    tolerance, every RGB channel of a pixels3d view must be within
+    `tolerance` of the color's, checked for the whole surface at once.
+    """
+    if tolerance <= 0:
+        pixels = pygame.surfarray.pixels2d(surface)
+        match = pixels == surface.map_rgb(color)
+    else:
+        pixels = pygame.surfarray.pixels3d(surface)
+        diff = np.abs(pixels.astype(np.int16) - np.asarray(color[:3], dtype=np.int16))
+        match = (diff <= tolerance).all(axis=2)
+    del pixels
+    return match
+
+
+def fillable_pixels(surface, fill_color, target_color=None, boundary_color=None, tolerance=0):
+    """(W, H) bool mask of pixels a fill may paint: those matching
+    `target_color` (flood fill), or those matching neither `boundary_color`
+    nor the fill color (boundary fill). `tolerance` widens the target and
+    boundary matches per channel."""
+    if target_color is not None:
+        return color_match(surface, target_color, tolerance)
+    return ~color_match(surface, boundary_color, tolerance) & ~color_match(surface, fill_color)
+
+
+def region_fill_components(surface, x, y, fill_color, target_color=None, boundary_color=None,
+                           connectivity=4, stats=None, tolerance=0, inside=None):
+    """Fill the region around (x, y) by connected-component labeling.
+
+    The fillable mask comes from `fillable_pixels` in one shot, unless the
+    caller already has it as `inside`. The component holding the seed is
+    then written with a single masked assignment. Returns the number of
+    pixels filled.
+    """
+    fill = surface.map_rgb(fill_color)
+    if inside is None:
+        inside = fillable_pixels(surface, fill_color, target_color, boundary_color, tolerance)
+    inside = inside.T  # (rows, cols)
+    if not inside[y, x]:
         return 0
+    pixels = pygame.surfarray.pixels2d(surface)
+    view = pixels.T
+    
+    rows, starts, ends, roots = label_runs(inside, connectivity)
+    k = inside.shape[1] + 2
+    seed = np.searchsorted(rows * k + starts, y * k + x, "right") - 1
+    chosen = roots == roots[seed]
     
+    # Rebuild the component mask from its runs with a cumulative sum
+    marks = np.zeros((inside.shape[0], inside.shape[1] + 1), dtype=np.int8)
+    marks[rows[chosen], starts[chosen]] = 1
+    marks[rows[chosen], ends[chosen] + 1] = -1
+    region = np.cumsum(marks, axis=1, dtype=np.int8)[:, :-1].astype(bool)
+    view[region] = fill
+    del pixels, view
+    if stats is not None:
+        stats["runs"] = len(rows)
+    return int(np.count_nonzero(region))
+
+
+class EdgeTable:
+    """Prebuilt edge table for a path of one or more contours.
+
+    Edges are stored once, sorted by ymin, with the winding direction of
+    each (+1 going down the screen, -1 going up) and the same exact integer
+    x stepping as `build_edge_table`. Fills only copy the active entries,
+    so one table can be filled again and again with either rule.
+    """
+    
+    def __init__(self, contours):
+        edges = []
+        for contour in contours:
+            n = len(contour)
+            for i in range(n):
+                x1, y1 = contour[i]
+                x2, y2 = contour[(i + 1) % n]
+                if y1 == y2:
+                    continue
+                winding = 1
+                if y1 > y2:
+                    x1, y1, x2, y2 = x2, y2, x1, y1
+                    winding = -1
+                dy = y2 - y1
+                step, rem_step = divmod(x2 - x1, dy)
+                edges.append((y1, y2, x1, step, rem_step, dy, winding))
+        edges.sort()
+        self.edges = edges
+        self.ymin = edges[0][0] if edges else 0
+        self.ymax = max((e[1] for e in edges), default=0)
+
+
+def fill_path(surface, table, fill_color, rule="evenodd", stats=None):
+    """Fill an EdgeTable with the even-odd or non-zero winding rule.
+
+    Each scanline y is sampled at the edges' exact crossings, and pixel x
+    is inside when the crossing at or left of x gives an inside state.
+    Spans run from ceil(x_left) to ceil(x_right) - 1, so abutting paths
+    never share pixels. Returns the number of pixels filled.
+    """
+    width, height = surface.get_size()
+    value = surface.map_rgb(fill_color)
+    pixels = pygame.surfarray.pixels2d(surface)
+    pixels_filled = 0
+    nonzero = rule == "nonzero"
+    
+    edges = table.edges
+    next_edge = 0
+    active = []
+    max_active = 0
+    y = table.ymin
+    while y < table.ymax:
+        while next_edge < len(edges) and edges[next_edge][0] == y:
+            _, ymax, x, step, rem_step, dy, winding = edges[next_edge]
+            active.append([ymax, x, 0, step, rem_step, dy, winding])
+            next_edge += 1
+        active = [e for e in active if e[0] > y]
+        max_active = max(max_active, len(active))
+        if not active:
+            if next_edge == len(edges):
+                break
+            y = edges[next_edge][0]
+            continue
+        
+        if 0 <= y < height:
+            # ceil(x + rem/dy) with the edge's winding, sorted left to right
+            crossings = sorted((e[1] + (e[2] > 0), e[6]) for e in active)
+            wind = 0
+            span_start = None
+            for x, winding in crossings:
+                before = wind
+                wind = wind + winding if nonzero else wind ^ 1
+                if before == 0 and wind != 0:
+                    span_start = x
+                elif before != 0 and wind == 0:
+                    left, right = max(span_start, 0), min(x, width)
+                    if left < right:
+                        pixels[left:right, y] = value
+                        pixels_filled += right - left
+        
+        for e in active:
+            e[1] += e[3]
+            e[2] += e[4]
+            if e[2] >= e[5]:
+                e[1] += 1
+                e[2] -= e[5]
+        y += 1
+    
+    del pixels
+    if stats is not None:
+        stats["max_active"] = max_active
+    return pixels_filled
+
+
+class RetainedPolygon:
+    """Polygon that keeps its scanline crossings and refills only what an edit touches.
+
+    Like `build_edge_table`, each non-horizontal edge is kept as
+    (ylow, yhigh, x, dx, dy) and crosses row y at the exact x
+    `scanline_fill` uses (same integer stepping and int() truncation).
+    Every row caches its crossings sorted as (x, edge) pairs. Moving a
+    vertex swaps out the crossings of its two edges only, and the pixels
+    that can change lie in the bounding box of those edges before and
+    after the move, so only that box is repainted.
+    """
+    
+    def __init__(self, vertices):
+        self.vertices = list(vertices)
+        self.version = 0
+        self._mesh = None
+        self._mesh_version = None
+        self.edges = [self._edge(i) for i in range(len(self.vertices))]
+        
+        # All crossings at once, then split into per-row sorted lists
+        records = [(i, e) for i, e in enumerate(self.edges) if e is not None]
+        self.crossings = {}
+        if not records:
+            return
+        ids = np.array([i for i, _ in records], dtype=np.int64)
+        ylow, yhigh, x, dx, dy = np.array([e for _, e in records], dtype=np.int64).T
+        counts = yhigh - ylow
+        edge = np.repeat(np.arange(len(ids)), counts)
+        k = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        carry, rem = np.divmod(k * dx[edge], dy[edge])
+        xs = x[edge] + carry
+        xs = np.where((xs < 0) & (rem != 0), xs + 1, xs)
+        rows, ids = ylow[edge] + k, ids[edge]
+        
+        order = np.lexsort((ids, xs, rows))
+        rows, pairs = rows[order], list(zip(xs[order].tolist(), ids[order].tolist()))
+        row_ids, starts = np.unique(rows, return_index=True)
+        bounds = starts.tolist() + [len(pairs)]
+        for n, y in enumerate(row_ids.tolist()):
+            self.crossings[y] = pairs[bounds[n]:bounds[n + 1]]
+    
+    def _edge(self, i):
+        (x1, y1), (x2, y2) = self.vertices[i], self.vertices[(i + 1) % len(self.vertices)]
+        if y1 == y2:
+            return None
+        if y1 > y2:
+            x1, y1, x2, y2 = x2, y2, x1, y1
+        return (y1, y2, x1, x2 - x1, y2 - y1)
+    
+    @staticmethod
+    def _crossing(edge, y):
+        ylow, _, x, dx, dy = edge
+        carry, rem = divmod((y - ylow) * dx, dy)
+        x += carry
+        return x + 1 if x < 0 and rem else x
+    
+    def _remove_edge(self, i):
+        edge = self.edges[i]
+        if edge is None:
+            return
+        for y in range(edge[0], edge[1]):
+            row = self.crossings[y]
+            del row[bisect.bisect_left(row, (self._crossing(edge, y), i))]
+            if not row:
+                del self.crossings[y]
+    
+    def _insert_edge(self, i):
+        edge = self.edges[i] = self._edge(i)
+        if edge is None:
+            return
+        for y in range(edge[0], edge[1]):
+            bisect.insort(self.crossings.setdefault(y, []), (self._crossing(edge, y), i))
+    
+    def _corner_rect(self, i):
+        n = len(self.vertices)
+        return stroke_rect([self.vertices[(i - 1) % n], self.vertices[i], self.vertices[(i + 1) % n]],
+                           2 * REDRAW_PAD)
+    
+    def move_vertex(self, i, pos):
+        """Move vertex i and update its two edges' crossings; returns the dirty rect"""
+        n = len(self.vertices)
+        before = self._corner_rect(i)
+        for e in ((i - 1) % n, i):
+            self._remove_edge(e)
+        self.vertices[i] = tuple(pos)
+        self.version += 1
+        for e in ((i - 1) % n, i):
+            self._insert_edge(e)
+        return before.union(self._corner_rect(i))
+    
+    def redraw(self, surface, rect, fill_color, outline_color, background):
+        """Repaint `rect`: background, cached spans, then the outline and
+        vertices that reach into it. Returns the rect actually painted."""
+        rect = rect.clip(surface.get_rect())
+        if not rect.width or not rect.height:
+            return rect
+        x0, x1, y0, y1 = rect.left, rect.right - 1, rect.top, rect.bottom - 1
+        
+        value = surface.map_rgb(fill_color)
+        pixels = pygame.surfarray.pixels2d(surface)
+        pixels[x0:x1 + 1, y0:y1 + 1] = surface.map_rgb(background)
+        for y in range(y0, y1 + 1):
+            row = self.crossings.get(y)
+            if not row:
+                continue
+            # Spans pair up sorted crossings; start at the pair holding x0
+            p = bisect.bisect_left(row, (x0, -1))
+            p -= p % 2
+            end = len(row) - len(row) % 2
+            while p < end and row[p][0] <= x1:
+                x_start, x_end = max(row[p][0], x0), min(row[p + 1][0], x1)
+                if x_start <= x_end:
+                    pixels[x_start:x_end + 1, y] = value
+                p += 2
+        del pixels
+        
+        pts = np.asarray(self.vertices, dtype=np.int64)
+        nxt = np.roll(pts, -1, axis=0)
+        pad = REDRAW_PAD
+        near = ((np.minimum(pts[:, 0], nxt[:, 0]) - pad <= x1) & (np.maximum(pts[:, 0], nxt[:, 0]) + pad >= x0)
+                & (np.minimum(pts[:, 1], nxt[:, 1]) - pad <= y1) & (np.maximum(pts[:, 1], nxt[:, 1]) + pad >= y0))
+        surface.set_clip(rect)
+        for e in np.flatnonzero(near).tolist():
+            (ax, ay), (bx, by) = self.vertices[e], self.vertices[(e + 1) % len(self.vertices)]
+            draw_thick_line(surface, ax, ay, bx, by, outline_color, 2 * OUTLINE_THICKNESS + 1)
+        for v in self.vertices:
+            if x0 - pad <= v[0] <= x1 + pad and y0 - pad <= v[1] <= y1 + pad:
+                pygame.draw.circle(surface, VERTEX_COLOR, v, VERTEX_RADIUS)
+        surface.set_clip(None)
+        return rect
+    
+    def mesh(self):
+        """Triangle mesh of the current shape, re-triangulated once per version"""
+        if self._mesh_version != self.version:
+            self._mesh = TriangleMesh(self.vertices)
+            self._mesh_version = self.version
+        return self._mesh
+    
+    def nearest_vertex(self, pos, max_dist=8):
+        """Index of the vertex within max_dist of pos, or None"""
+        best, best_d2 = None, max_dist * max_dist
+        for i, (vx, vy) in enumerate(self.vertices):
+            d2 = (vx - pos[0]) ** 2 + (vy - pos[1]) ** 2
+            if d2 <= best_d2:
+                best, best_d2 = i, d2
+        return best
+
+
+def _seed_fill(surface, x, y, fill_color, inside, neighbours, mask, breadth_first, stats):
+    """Pixel-at-a-time seed fill shared by the flood and boundary fills.
+
+    `inside` is the (W, H) fillable mask, taken before anything is painted:
+    a fill only ever paints pixels it has stamped as visited, so the
+    initial mask stays valid throughout. It is flattened to bytes so each
+    test is a plain index, and the stamped region is written to the
+    surface in one assignment at the end.
+    """
     pixels_filled = 0
     queue = deque([(x, y)])
-    visited = set()
+    pop = queue.popleft if breadth_first else queue.pop
+    max_queue = 1
+    mask = mask or visit_mask_for(surface)
+    generation = mask.begin()
+    stamps = mask.stamps
+    width, height = mask.width, mask.height
+    fillable = inside.T.tobytes()
     
     while queue:
-        cx, cy = queue.popleft()
+        max_queue = max(max_queue, len(queue))
+        cx, cy = pop()
         
-        if (cx, cy) in visited:
+        if cx < 0 or cx >= width or cy < 0 or cy >= height:
             continue
-        if cx < 0 or cx >= surface.get_width() or cy < 0 or cy >= surface.get_height():
+        index = cy * width + cx
+        if stamps[index] == generation or not fillable[index]:
             continue
         
-        if surface.get_at((cx, cy))[:3] != target_color:
-            continue
-        
-        surface.set_at((cx, cy), fill_color)
-        visited.add((cx, cy))
+        stamps[index] = generation
         pixels_filled += 1
-        
-        # 4-connected neighbors
-        queue.append((cx + 1, cy))
-        queue.append((cx - 1, cy))
-        queue.append((cx, cy + 1))
-        queue.append((cx, cy - 1))
+        for dx, dy in neighbours:
+            queue.append((cx + dx, cy + dy))
     
+    region = np.frombuffer(stamps, dtype=np.uint8).reshape(height, width) == generation
+    pixels = pygame.surfarray.pixels2d(surface)
+    pixels.T[region] = surface.map_rgb(fill_color)
+    del pixels
+    
+    if stats is not None:
+        stats["max_queue" if breadth_first else "max_stack"] = max_queue
     return pixels_filled
 
 
-def flood_fill_8(surface, x, y, fill_color, target_color):
+NEIGHBOURS_4 = ((1, 0), (-1, 0), (0, 1), (0, -1))
+NEIGHBOURS_8 = tuple((dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1) if dx or dy)
+
+
+def flood_fill_4(surface, x, y, fill_color, target_color, mask=None, engine="queue", stats=None, tolerance=0):
+    """4-connected Flood Fill using BFS"""
+    if x < 0 or x >= surface.get_width() or y < 0 or y >= surface.get_height():
+        return 0
+    
+    inside = color_match(surface, target_color, tolerance)
+    if not inside[x, y] or pixel_value(surface, x, y) == surface.map_rgb(fill_color):
+        return 0
+    
+    if engine == "components":
+        return region_fill_components(surface, x, y, fill_color, connectivity=4, stats=stats, inside=inside)
+    return _seed_fill(surface, x, y, fill_color, inside, NEIGHBOURS_4, mask, True, stats)
+
+
+def flood_fill_8(surface, x, y, fill_color, target_color, mask=None, engine="queue", stats=None, tolerance=0):
     """8-connected Flood Fill using BFS"""
     if x < 0 or x >= surface.get_width() or y < 0 or y >= surface.get_height():
         return 0
     
-    start_color = surface.get_at((x, y))[:3]
-    if start_color == fill_color or start_color != target_color:
+    inside = color_match(surface, target_color, tolerance)
+    if not inside[x, y] or pixel_value(surface, x, y) == surface.map_rgb(fill_color):
+        return 0
+    
+    if engine == "components":
+        return region_fill_components(surface, x, y, fill_color, connectivity=8, stats=stats, inside=inside)
+    return _seed_fill(surface, x, y, fill_color, inside, NEIGHBOURS_8, mask, True, stats)
+
+
+def span_flood_fill(surface, x, y, fill_color, target_color, connectivity=4, stats=None):
+    """Scanline seed fill: expands whole horizontal runs instead of pixels.
+
+    Works on a surfarray view of the surface. Each popped seed grows into
+    its full run with one vectorized search per side and is filled with a
+    single slice write. Only one seed per target-colored run on the rows
+    above and below is pushed.
+    """
+    width, height = surface.get_size()
+    if x < 0 or x >= width or y < 0 or y >= height:
         return 0
     
+    target = surface.map_rgb(target_color)
+    fill = surface.map_rgb(fill_color)
+    pixels = pygame.surfarray.pixels2d(surface)
+    if pixels[x, y] != target or fill == target:
+        del pixels
+        return 0
+    
+    reach = 1 if connectivity == 8 else 0
     pixels_filled = 0
-    queue = deque([(x, y)])
-    visited = set()
+    stack = [(x, y)]
+    max_stack = 1
     
-    while queue:
-        cx, cy = queue.popleft()
-        
-        if (cx, cy) in visited:
-            continue
-        if cx < 0 or cx >= surface.get_width() or cy < 0 or cy >= surface.get_height():
-            continue
-        
-        if surface.get_at((cx, cy))[:3] != target_color:
+    while stack:
+        max_stack = max(max_stack, len(stack))
+        sx, sy = stack.pop()
+        row = pixels[:, sy]
+        if row[sx] != target:
             continue
         
-        surface.set_at((cx, cy), fill_color)
-        visited.add((cx, cy))
-        pixels_filled += 1
+        # Grow the run to both sides
+        left = np.flatnonzero(row[:sx] != target)
+        right = np.flatnonzero(row[sx + 1:] != target)
+        xl = left[-1] + 1 if len(left) else 0
+        xr = sx + right[0] if len(right) else width - 1
+        row[xl:xr + 1] = fill
+        pixels_filled += xr - xl + 1
         
-        # 8-connected neighbors
-        for dx in [-1, 0, 1]:
-            for dy in [-1, 0, 1]:
-                if dx != 0 or dy != 0:
-                    queue.append((cx + dx, cy + dy))
+        # One seed per target run on the neighbouring rows
+        lo, hi = max(xl - reach, 0), min(xr + reach, width - 1)
+        for ny in (sy - 1, sy + 1):
+            if 0 <= ny < height:
+                seg = pixels[lo:hi + 1, ny] == target
+                run_starts = np.flatnonzero(seg[1:] & ~seg[:-1]) + 1
+                if seg[0]:
+                    stack.append((lo, ny))
+                stack.extend((lo + int(s), ny) for s in run_starts)
     
+    del pixels
+    if stats is not None:
+        stats["max_stack"] = max_stack
     return pixels_filled
 
 
-def boundary_fill(surface, x, y, fill_color, boundary_color):
+def boundary_fill(surface, x, y, fill_color, boundary_color, mask=None, engine="queue", stats=None, tolerance=0):
     """Boundary Fill Algorithm (4-connected)"""
     if x < 0 or x >= surface.get_width() or y < 0 or y >= surface.get_height():
         return 0
     
-    current_color = surface.get_at((x, y))[:3]
-    if current_color == fill_color or current_color == boundary_color:
+    inside = fillable_pixels(surface, fill_color, boundary_color=boundary_color, tolerance=tolerance)
+    if not inside[x, y]:
         return 0
     
-    pixels_filled = 0
-    stack = [(x, y)]
-    visited = set()
+    if engine == "components":
+        return region_fill_components(surface, x, y, fill_color, stats=stats, inside=inside)
+    return _seed_fill(surface, x, y, fill_color, inside, NEIGHBOURS_4, mask, False, stats)
+
+
+def boundary_fill_spans(surface, x, y, fill_color, boundary_color, mask=None, stats=None):
+    """Boundary fill with an explicit stack of horizontal spans (after Heckbert's seed fill).
+
+    Work is a filled span on row y whose neighbours on row y + dy still
+    need scanning. Every fillable run found there is filled with one slice
+    write and queued onward in both directions. At most one span is kept
+    per (row, direction); a new one is merged into the covering interval,
+    so the stack never exceeds 2 * height entries whatever the shape. A
+    covering interval may bridge columns this fill never reached, so a run
+    is only taken if it touches a pixel stamped in the visit mask on the
+    row it was scanned from; fill-coloured pixels that were already there
+    stay walls, as in `boundary_fill`. Reports the deepest stack in
+    stats["max_stack"].
+    """
+    width, height = surface.get_size()
+    if x < 0 or x >= width or y < 0 or y >= height:
+        return 0
+    
+    fill = surface.map_rgb(fill_color)
+    boundary = surface.map_rgb(boundary_color)
+    pixels = pygame.surfarray.pixels2d(surface)
+    if pixels[x, y] == fill or pixels[x, y] == boundary:
+        del pixels
+        return 0
+    
+    mask = mask or visit_mask_for(surface)
+    generation = mask.begin()
+    region = np.frombuffer(mask.stamps, dtype=np.uint8).reshape(height, width)
+    pending, stack = {}, []  # (row, dy) -> [x1, x2]; keys in push order
+    
+    def push(row, x1, x2, dy):
+        if not 0 <= row + dy < height:
+            return
+        span = pending.get((row, dy))
+        if span is None:
+            pending[row, dy] = [x1, x2]
+            stack.append((row, dy))
+        else:
+            span[0], span[1] = min(span[0], x1), max(span[1], x2)
+    
+    # The seed's run, then its neighbours above and below
+    row = pixels[:, y]
+    walls = np.flatnonzero((row == boundary) | (row == fill))
+    xl = int(walls[walls < x][-1]) + 1 if (walls < x).any() else 0
+    xr = int(walls[walls > x][0]) - 1 if (walls > x).any() else width - 1
+    row[xl:xr + 1] = fill
+    region[y, xl:xr + 1] = generation
+    pixels_filled = xr - xl + 1
+    push(y, xl, xr, 1)
+    push(y, xl, xr, -1)
+    max_stack = len(stack)
     
     while stack:
-        cx, cy = stack.pop()
-        
-        if (cx, cy) in visited:
-            continue
-        if cx < 0 or cx >= surface.get_width() or cy < 0 or cy >= surface.get_height():
+        max_stack = max(max_stack, len(stack))
+        py, dy = stack.pop()
+        x1, x2 = pending.pop((py, dy))
+        ny = py + dy
+        row = pixels[:, ny]
+        open_ = (row[x1:x2 + 1] != boundary) & (row[x1:x2 + 1] != fill)
+        if not open_.any():
             continue
         
-        pixel_color = surface.get_at((cx, cy))[:3]
-        if pixel_color == boundary_color or pixel_color == fill_color:
+        # Open runs overlapping [x1, x2] that touch this fill on row py
+        edges = np.flatnonzero(np.diff(np.concatenate(([False], open_, [False])).astype(np.int8)))
+        starts, ends = edges[0::2], edges[1::2] - 1
+        touch = (open_ & (region[py, x1:x2 + 1] == generation)).astype(np.int32)
+        keep = np.add.reduceat(touch, starts) > 0
+        if not keep.any():
             continue
+        reaches_left, reaches_right = keep[0] and starts[0] == 0, keep[-1] and ends[-1] == x2 - x1
+        starts, ends = starts[keep] + x1, ends[keep] + x1
         
-        surface.set_at((cx, cy), fill_color)
-        visited.add((cx, cy))
-        pixels_filled += 1
+        # The outer runs may continue past the scanned interval
+        if reaches_left:
+            left = np.flatnonzero((row[:x1] == boundary) | (row[:x1] == fill))
+            starts[0] = left[-1] + 1 if len(left) else 0
+        if reaches_right:
+            right = np.flatnonzero((row[x2 + 1:] == boundary) | (row[x2 + 1:] == fill))
+            ends[-1] = x2 + right[0] if len(right) else width - 1
         
-        # 4-connected neighbors
-        stack.append((cx + 1, cy))
-        stack.append((cx - 1, cy))
-        stack.append((cx, cy + 1))
-        stack.append((cx, cy - 1))
+        for xl, xr in zip(starts.tolist(), ends.tolist()):
+            row[xl:xr + 1] = fill
+            region[ny, xl:xr + 1] = generation
+            pixels_filled += xr - xl + 1
+            push(ny, xl, xr, dy)
+            push(ny, xl, xr, -dy)
     
+    del pixels, region
+    if stats is not None:
+        stats["max_stack"] = max_stack
     return pixels_filled
 
 
-def draw_polygon(surface, vertices, color, thickness=2):
-    """Draw polygon outline with thickness to prevent gaps"""
+def stroke_rect(points, width):
+    """Rect covering a round-capped stroke of `width` through the points"""
+    xs, ys = zip(*points)
+    pad = width // 2 + 1
+    return pygame.Rect(min(xs) - pad, min(ys) - pad,
+                       max(xs) - min(xs) + 2 * pad + 1, max(ys) - min(ys) + 2 * pad + 1)
+
+
+def draw_polygon(surface, vertices, color, thickness=OUTLINE_THICKNESS):
+    """Draw polygon outline with thickness to prevent gaps; returns the touched rect"""
     if len(vertices) < 2:
-        return
+        return pygame.Rect(0, 0, 0, 0)
     
+    # Round-capped strokes overlap at shared vertices, so joins are closed
     for i in range(len(vertices)):
         x1, y1 = vertices[i]
         x2, y2 = vertices[(i + 1) % len(vertices)]
-        
-        # Draw thicker lines to prevent gaps
-        draw_line_bresenham(surface, x1, y1, x2, y2, color)
-        
-        # Add extra pixels around each line to ensure no gaps
-        for dx in range(-thickness, thickness + 1):
-            for dy in range(-thickness, thickness + 1):
-                if dx*dx + dy*dy <= thickness*thickness:
-                    draw_line_bresenham(surface, x1+dx, y1+dy, x2+dx, y2+dy, color)
-        
-        # Extra reinforcement at vertices to close gaps
-        for dx in range(-thickness-1, thickness+2):
-            for dy in range(-thickness-1, thickness+2):
-                if dx*dx + dy*dy <= (thickness+1)*(thickness+1):
-                    px, py = x1 + dx, y1 + dy
-                    if 0 <= px < surface.get_width() and 0 <= py < surface.get_height():
-                        surface.set_at((px, py), color)
+        draw_thick_line(surface, x1, y1, x2, y2, color, 2 * thickness + 1)
+    return stroke_rect(vertices, 2 * thickness + 1)
 
 
 def point_in_polygon(x, y, polygon):
@@ -256,16 +994,517 @@ def point_in_polygon(x, y, polygon):
     return inside
 
 
-def draw_panel(screen, font, small_font, mode, vertices, fill_result):
-    """Draw the control panel"""
+def fill_memory_note(scratch, fill, *args, **kwargs):
+    """Peak memory of a seed fill, for the result panel.
+
+    The fill is repeated on `scratch`, a copy of the surface as it was
+    before the timed fill, under tracemalloc, so the timing shown next to
+    it stays untraced (the same split `benchmark_matrix` makes). The queue
+    engine's visit mask outlives the fill, so it is listed separately.
+    """
+    tracemalloc.start()
+    fill(scratch, *args, **kwargs)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    note = f"Peak: {peak / 1024:.0f} KB"
+    if kwargs.get("engine", "queue") == "queue":
+        note += f" (+{visit_mask_for(scratch).nbytes / 1024:.0f} KB mask)"
+    return note
+
+
+def points_in_polygon(points, polygon):
+    """Vectorized `point_in_polygon` for an (N, 2) array of points.
+
+    Every point is tested against every edge at once by broadcasting, with
+    the same crossing rule as the scalar ray cast. Returns a bool array.
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    if len(polygon) < 3:
+        return np.zeros(len(points), dtype=bool)
+    p1 = np.asarray(polygon, dtype=np.float64)
+    p2 = np.roll(p1, -1, axis=0)
+    x, y = points[:, 0:1], points[:, 1:2]
+    p1x, p1y, p2x, p2y = p1[:, 0], p1[:, 1], p2[:, 0], p2[:, 1]
+    
+    spans = (y > np.minimum(p1y, p2y)) & (y <= np.maximum(p1y, p2y))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        xinters = (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
+    crosses = spans & (x <= xinters)
+    return np.count_nonzero(crosses, axis=1) % 2 == 1
+
+
+class PolygonIndex:
+    """Per-scanline slab index for many hit tests against one polygon.
+
+    For every integer scanline the ray-cast crossings are precomputed and
+    stored sorted, so classifying a point is a binary search in its row:
+    O(log edges) per query, done for all queries at once. Points with a
+    fractional y fall back to `points_in_polygon`.
+    """
+    
+    def __init__(self, polygon):
+        self.polygon = list(polygon)
+        pts = np.asarray(self.polygon, dtype=np.int64).reshape(-1, 2)
+        p1x, p1y = pts[:, 0], pts[:, 1]
+        p2x, p2y = np.roll(p1x, -1), np.roll(p1y, -1)
+        
+        # A ray at y crosses an edge when min(y1, y2) < y <= max(y1, y2)
+        lo, hi = np.minimum(p1y, p2y), np.maximum(p1y, p2y)
+        counts = hi - lo
+        edge = np.repeat(np.arange(len(pts)), counts)
+        rows = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts) + lo[edge] + 1
+        xs = (rows - p1y[edge]) * (p2x[edge] - p1x[edge]) / (p2y[edge] - p1y[edge]) + p1x[edge]
+        
+        order = np.lexsort((xs, rows))
+        self.xs = xs[order]
+        self.y0 = int(lo.min()) + 1 if len(pts) else 0
+        row_ids = np.arange(self.y0, int(hi.max()) + 2 if len(pts) else 0)
+        bounds = np.searchsorted(rows[order], row_ids)
+        self.row_start, self.row_end = bounds[:-1], bounds[1:]
+        self.steps = int(np.ceil(np.log2(max(int((self.row_end - self.row_start).max(initial=0)), 1) + 1)))
+    
+    def contains(self, points):
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        inside = np.zeros(len(points), dtype=bool)
+        if len(self.polygon) < 3:
+            return inside
+        
+        whole = points[:, 1] == np.floor(points[:, 1])
+        if not whole.all():
+            inside[~whole] = points_in_polygon(points[~whole], self.polygon)
+        
+        qx = points[whole, 0]
+        row = points[whole, 1].astype(np.int64) - self.y0
+        valid = (row >= 0) & (row < len(self.row_start))
+        row = np.where(valid, row, 0)
+        start = np.where(valid, self.row_start[row], 0)
+        end = np.where(valid, self.row_end[row], 0)
+        
+        # Lockstep binary search: first crossing with x >= qx in each row
+        lo, hi = start.copy(), end.copy()
+        for _ in range(self.steps):
+            searching = lo < hi
+            mid = (lo + hi) // 2
+            left = searching & (self.xs[np.minimum(mid, len(self.xs) - 1)] < qx)
+            lo = np.where(left, mid + 1, lo)
+            hi = np.where(searching & ~left, mid, hi)
+        inside[whole] = (end - lo) % 2 == 1
+        return inside
+
+
+def _signed_area2(pts):
+    """Twice the signed shoelace area of an (N, 2) int array"""
+    x, y = pts[:, 0], pts[:, 1]
+    return int(np.dot(x, np.roll(y, -1)) - np.dot(np.roll(x, -1), y))
+
+
+def _cross(o, a, b):
+    return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+
+def _ring(vertices):
+    """Vertex indices with repeated points dropped, ordered with positive area"""
+    ring = [i for i in range(len(vertices)) if vertices[i] != vertices[i - 1]]
+    if len(ring) >= 3 and _signed_area2(np.asarray([vertices[i] for i in ring], dtype=np.int64)) < 0:
+        ring.reverse()
+    return ring
+
+
+def ear_clip(vertices):
+    """Triangulate a simple polygon by ear clipping; returns (T, 3) indices.
+
+    O(n^2): each candidate ear is checked against the remaining reflex
+    vertices only, all at once with numpy.
+    """
+    pts = np.asarray(vertices, dtype=np.int64).reshape(-1, 2)
+    ring = _ring(vertices)
+    triangles = []
+    
+    while len(ring) > 3:
+        ring_pts = pts[ring]
+        prev_pts, next_pts = np.roll(ring_pts, 1, axis=0), np.roll(ring_pts, -1, axis=0)
+        turn = ((ring_pts[:, 0] - prev_pts[:, 0]) * (next_pts[:, 1] - ring_pts[:, 1])
+                - (ring_pts[:, 1] - prev_pts[:, 1]) * (next_pts[:, 0] - ring_pts[:, 0]))
+        reflex_at = np.flatnonzero(turn < 0)
+        n = len(ring)
+        
+        clipped = None
+        for k in np.flatnonzero(turn > 0).tolist():
+            a, b, c = prev_pts[k], ring_pts[k], next_pts[k]
+            # The ear's own corners may be reflex; only the others can block it
+            reflex = ring_pts[reflex_at[(reflex_at != (k - 1) % n) & (reflex_at != (k + 1) % n)]]
+            if len(reflex):
+                # Closed-triangle containment; an ear may not touch a reflex vertex
+                d1 = (b[0] - a[0]) * (reflex[:, 1] - a[1]) - (b[1] - a[1]) * (reflex[:, 0] - a[0])
+                d2 = (c[0] - b[0]) * (reflex[:, 1] - b[1]) - (c[1] - b[1]) * (reflex[:, 0] - b[0])
+                d3 = (a[0] - c[0]) * (reflex[:, 1] - c[1]) - (a[1] - c[1]) * (reflex[:, 0] - c[0])
+                if ((d1 >= 0) & (d2 >= 0) & (d3 >= 0)).any():
+                    continue
+            clipped = k
+            break
+        
+        if clipped is None:
+            # Only degenerate (collinear) or self-touching corners remain
+            flat = np.flatnonzero(turn == 0)
+            clipped = int(flat[0]) if len(flat) else int(np.argmax(turn))
+            if turn[clipped] == 0:
+                ring.pop(clipped)
+                continue
+        
+        triangles.append((ring[clipped - 1], ring[clipped], ring[(clipped + 1) % n]))
+        ring.pop(clipped)
+    
+    if len(ring) == 3:
+        triangles.append(tuple(ring))
+    return np.asarray(triangles, dtype=np.int64).reshape(-1, 3)
+
+
+def _monotone_diagonals(pts, ring):
+    """Sweep from the top and return the diagonals that cut the polygon into
+    y-monotone pieces (split and merge vertices get resolved via helpers).
+
+    Returns None when the sweep state contradicts a simple polygon: an edge
+    ends without having been opened, or no edge lies left of a vertex.
+    """
+    n = len(ring)
+
+    def above(p, q):
+        return p[1] > q[1] or (p[1] == q[1] and p[0] < q[0])
+
+    def sweep_key(k):
+        return -pts[ring[k]][1], pts[ring[k]][0]
+
+    order = sorted(range(n), key=sweep_key)
+    
+    kind = []
+    for k in range(n):
+        prev, cur, nxt = pts[ring[k - 1]], pts[ring[k]], pts[ring[(k + 1) % n]]
+        convex = _cross(prev, cur, nxt) > 0
+        if above(cur, prev) and above(cur, nxt):
+            kind.append("start" if convex else "split")
+        elif above(prev, cur) and above(nxt, cur):
+            kind.append("end" if convex else "merge")
+        else:
+            kind.append("regular")
+    
+    def x_at(e, y):
+        (x1, y1), (x2, y2) = pts[ring[e]], pts[ring[(e + 1) % n]]
+        if y1 == y2:
+            return max(x1, x2)
+        return x1 + (y - y1) * (x2 - x1) / (y2 - y1)
+    
+    def left_of(k):
+        x, y = pts[ring[k]]
+        best, best_x = None, None
+        for e in status:
+            if e == k or (e + 1) % n == k:
+                continue
+            ex = x_at(e, y)
+            if ex <= x and (best is None or ex > best_x):
+                best, best_x = e, ex
+        return best
+    
+    status, helper, diagonals = set(), {}, []
+    
+    def link(k, h):
+        diagonals.append((k, h))
+    
+    for k in order:
+        prev_edge = (k - 1) % n
+        # Left chain vertices, like end and merge vertices, close their
+        # incoming edge; it must be in the status if the polygon is simple
+        left_chain = kind[k] == "regular" and above(pts[ring[k - 1]], pts[ring[k]])
+        if (kind[k] in ("end", "merge") or left_chain) and prev_edge not in status:
+            return None
+        if kind[k] == "start":
+            status.add(k)
+            helper[k] = k
+        elif kind[k] == "end":
+            if kind[helper[prev_edge]] == "merge":
+                link(k, helper[prev_edge])
+            status.discard(prev_edge)
+        elif kind[k] == "split":
+            e = left_of(k)
+            if e is None:
+                return None
+            link(k, helper[e])
+            helper[e] = k
+            status.add(k)
+            helper[k] = k
+        elif kind[k] == "merge":
+            if kind[helper[prev_edge]] == "merge":
+                link(k, helper[prev_edge])
+            status.discard(prev_edge)
+            e = left_of(k)
+            if e is None:
+                return None
+            if kind[helper[e]] == "merge":
+                link(k, helper[e])
+            helper[e] = k
+        elif left_chain:
+            # Interior lies to the right
+            if kind[helper[prev_edge]] == "merge":
+                link(k, helper[prev_edge])
+            status.discard(prev_edge)
+            status.add(k)
+            helper[k] = k
+        else:
+            e = left_of(k)
+            if e is None:
+                return None
+            if kind[helper[e]] == "merge":
+                link(k, helper[e])
+            helper[e] = k
+    return diagonals
+
+
+def _monotone_pieces(pts, ring, diagonals):
+    """Trace the faces of the polygon cut along the diagonals (ring positions)"""
+    n = len(ring)
+    neighbours = [[(k - 1) % n, (k + 1) % n] for k in range(n)]
+    for a, b in diagonals:
+        neighbours[a].append(b)
+        neighbours[b].append(a)
+    
+    # Neighbours sorted by angle, so the next edge of a face is one step clockwise
+    for k in range(n):
+        x, y = pts[ring[k]]
+        neighbours[k].sort(key=lambda j: math.atan2(pts[ring[j]][1] - y, pts[ring[j]][0] - x))
+    
+    used, pieces = set(), []
+    for start in range(n):
+        edge = (start, (start + 1) % n)
+        if edge in used:
+            continue
+        piece = []
+        while edge not in used:
+            used.add(edge)
+            u, v = edge
+            piece.append(u)
+            around = neighbours[v]
+            edge = (v, around[around.index(u) - 1])
+        pieces.append(piece)
+    return pieces
+
+
+def _triangulate_monotone(pts, ring, piece):
+    """Stack-based triangulation of one y-monotone piece (ring positions)"""
+    if len(piece) == 3:
+        return [tuple(piece)]
+
+    def key(k):
+        return -pts[ring[k]][1], pts[ring[k]][0]
+
+    def p(k):
+        return pts[ring[k]]
+
+    top = min(range(len(piece)), key=lambda i: key(piece[i]))
+    bottom = max(range(len(piece)), key=lambda i: key(piece[i]))
+    
+    # Walking forward from the top runs down the left chain
+    side, i = {}, top
+    while i != bottom:
+        side[piece[i]] = "left"
+        i = (i + 1) % len(piece)
+    for k in piece:
+        side.setdefault(k, "right")
+    
+    order = sorted(piece, key=key)
+    stack, triangles = order[:2], []
+    for u in order[2:-1]:
+        if side[u] != side[stack[-1]]:
+            triangles.extend((u, stack[i], stack[i + 1]) for i in range(len(stack) - 1))
+            stack = [stack[-1], u]
+        else:
+            last = stack.pop()
+            while stack:
+                if side[u] == "left":
+                    inside = _cross(p(stack[-1]), p(last), p(u)) > 0
+                else:
+                    inside = _cross(p(u), p(last), p(stack[-1])) > 0
+                if not inside:
+                    break
+                triangles.append((u, last, stack[-1]))
+                last = stack.pop()
+            stack.extend((last, u))
+    u = order[-1]
+    triangles.extend((u, stack[i], stack[i + 1]) for i in range(len(stack) - 1))
+    return triangles
+
+
+def monotone_triangulate(vertices):
+    """Triangulate by monotone partition then per-piece stack sweeps.
+
+    The sort and the per-piece sweeps are O(n log n), but the status is a
+    plain set searched linearly for the edge left of each split, merge and
+    right-chain vertex, so the worst case is O(n^2) like ear clipping. In
+    practice few edges are active at once, which keeps it much faster.
+    Returns (T, 3) indices, or None if the polygon is too degenerate for
+    the sweep (the caller falls back to ear clipping).
+    """
+    pts = [tuple(v) for v in vertices]
+    ring = _ring(pts)
+    if len(ring) < 3:
+        return np.zeros((0, 3), dtype=np.int64)
+    diagonals = _monotone_diagonals(pts, ring)
+    if diagonals is None:
+        return None
+    pieces = _monotone_pieces(pts, ring, diagonals)
+    triangles = [t for piece in pieces for t in _triangulate_monotone(pts, ring, piece)]
+    
+    triangles = np.asarray([[ring[a], ring[b], ring[c]] for a, b, c in triangles], dtype=np.int64).reshape(-1, 3)
+    arr = np.asarray(pts, dtype=np.int64)
+    a, b, c = arr[triangles[:, 0]], arr[triangles[:, 1]], arr[triangles[:, 2]]
+    areas = (b[:, 0] - a[:, 0]) * (c[:, 1] - a[:, 1]) - (b[:, 1] - a[:, 1]) * (c[:, 0] - a[:, 0])
+    # n - 2 triangles whose areas add up to the polygon's, or the sweep failed
+    if len(triangles) != len(ring) - 2 or np.abs(areas).sum() != _signed_area2(arr[ring]):
+        return None
+    flip = areas < 0
+    triangles[flip] = triangles[flip][:, [0, 2, 1]]
+    return triangles
+
+
+def triangulate(vertices):
+    """Triangle index list for a polygon: ear clipping for small inputs,
+    the monotone-partition path (with ear clipping as fallback) for large"""
+    if len(vertices) > MONOTONE_MIN_VERTICES:
+        triangles = monotone_triangulate(vertices)
+        if triangles is not None:
+            return triangles
+    return ear_clip(vertices)
+
+
+def rasterize_triangles(surface, points, triangles, color):
+    """Fill triangles with exact integer half-space tests and the top-left rule.
+
+    Pixel (x, y) is sampled at integer coordinates. A pixel exactly on an
+    edge belongs to the triangle only if that edge is a top or left edge,
+    so triangles sharing an edge never both write it and never leave a gap.
+    Each row's span comes from integer floor/ceil divisions of the three
+    edge functions, and all spans are expanded and written in one scatter.
+    """
+    pts = np.asarray(points, dtype=np.int64).reshape(-1, 2)
+    tri = np.asarray(triangles, dtype=np.int64).reshape(-1, 3)
+    a, b, c = pts[tri[:, 0]], pts[tri[:, 1]], pts[tri[:, 2]]
+    area = (b[:, 0] - a[:, 0]) * (c[:, 1] - a[:, 1]) - (b[:, 1] - a[:, 1]) * (c[:, 0] - a[:, 0])
+    b, c = np.where((area < 0)[:, None], c, b), np.where((area < 0)[:, None], b, c)
+    keep = area != 0
+    a, b, c = a[keep], b[keep], c[keep]
+    
+    clip = surface.get_clip()
+    ys = np.stack([a[:, 1], b[:, 1], c[:, 1]])
+    top = np.maximum(ys.min(axis=0), clip.top)
+    heights = np.maximum(np.minimum(ys.max(axis=0), clip.bottom - 1) - top + 1, 0)
+    total = int(heights.sum())
+    if total == 0:
+        return 0
+    
+    idx = np.repeat(np.arange(len(a)), heights)
+    y = top[idx] + np.arange(total) - np.repeat(np.cumsum(heights) - heights, heights)
+    lo = np.full(total, clip.left, dtype=np.int64)
+    hi = np.full(total, clip.right - 1, dtype=np.int64)
+    
+    for p, q in ((a, b), (b, c), (c, a)):
+        dx, dy = (q[:, 0] - p[:, 0])[idx], (q[:, 1] - p[:, 1])[idx]
+        px, py = p[idx, 0], p[idx, 1]
+        bias = ((dy < 0) | ((dy == 0) & (dx > 0))).astype(np.int64)
+        # Inside when -dy * x >= t, i.e. edge function + bias > 0
+        t = 1 - bias - (dx * (y - py) + dy * px)
+        coef = -dy
+        safe = np.where(coef == 0, 1, coef)
+        lo = np.where(coef > 0, np.maximum(lo, -(-t // safe)), lo)
+        hi = np.where(coef < 0, np.minimum(hi, t // safe), hi)
+        hi = np.where((coef == 0) & (t > 0), lo - 1, hi)
+    
+    counts = np.maximum(hi - lo + 1, 0)
+    count = int(counts.sum())
+    row = np.repeat(np.arange(total), counts)
+    xs = lo[row] + np.arange(count) - np.repeat(np.cumsum(counts) - counts, counts)
+    
+    pixels = pygame.surfarray.pixels2d(surface)
+    pixels[xs, y[row]] = surface.map_rgb(color)
+    del pixels
+    return count
+
+
+class TriangleMesh:
+    """Triangulated polygon: one triangle list reused for filling, hit
+    testing and export to the 3D labs"""
+    
+    def __init__(self, vertices, triangles=None):
+        self.vertices = [tuple(v) for v in vertices]
+        self.triangles = triangulate(self.vertices) if triangles is None else triangles
+    
+    def fill(self, surface, color):
+        return rasterize_triangles(surface, self.vertices, self.triangles, color)
+    
+    def draw_wireframe(self, surface, color):
+        for i, j, k in self.triangles.tolist():
+            pygame.draw.polygon(surface, color, [self.vertices[i], self.vertices[j], self.vertices[k]], 1)
+    
+    def contains(self, points, chunk=4096):
+        """Hit test with the rasterizer's own top-left rule, so a point is
+        inside exactly when `fill` would write its pixel"""
+        points = np.asarray(points, dtype=np.int64).reshape(-1, 2)
+        inside = np.zeros(len(points), dtype=bool)
+        pts = np.asarray(self.vertices, dtype=np.int64).reshape(-1, 2)
+        tri = self.triangles
+        a, b, c = pts[tri[:, 0]], pts[tri[:, 1]], pts[tri[:, 2]]
+        area = (b[:, 0] - a[:, 0]) * (c[:, 1] - a[:, 1]) - (b[:, 1] - a[:, 1]) * (c[:, 0] - a[:, 0])
+        b, c = np.where((area < 0)[:, None], c, b), np.where((area < 0)[:, None], b, c)
+        a, b, c = a[area != 0], b[area != 0], c[area != 0]
+        
+        for s in range(0, len(points), chunk):
+            qx, qy = points[s:s + chunk, 0:1], points[s:s + chunk, 1:2]
+            hit = np.ones((len(qx), len(a)), dtype=bool)
+            for p, q in ((a, b), (b, c), (c, a)):
+                dx, dy = q[:, 0] - p[:, 0], q[:, 1] - p[:, 1]
+                bias = (dy < 0) | ((dy == 0) & (dx > 0))
+                w = dx * (qy - p[:, 1]) - dy * (qx - p[:, 0])
+                hit &= w + bias > 0
+            inside[s:s + chunk] = hit.any(axis=1)
+        return inside
+    
+    def export(self, path=None, z=0.0):
+        """Mesh as vertices/edges/triangles, matching lab3's Object3D(vertices, edges, ...).
+        Also written to `path` as JSON when given."""
+        edges = set()
+        for i, j, k in self.triangles.tolist():
+            edges.update(tuple(sorted(e)) for e in ((i, j), (j, k), (k, i)))
+        mesh = {
+            "vertices": [[float(x), float(y), float(z)] for x, y in self.vertices],
+            "edges": sorted(list(e) for e in edges),
+            "triangles": self.triangles.tolist(),
+        }
+        if path:
+            with open(path, "w") as f:
+                json.dump(mesh, f, indent=1)
+        return mesh
+
+
+_text_cache = {}
+
+
+def render_text(font, text, color):
+    """font.render, cached until the text (or its font/color) changes"""
+    key = (id(font), text, color)
+    if key not in _text_cache:
+        if len(_text_cache) >= TEXT_CACHE_SIZE:
+            _text_cache.clear()
+        _text_cache[key] = font.render(text, True, color)
+    return _text_cache[key]
+
+
+def draw_panel(screen, font, small_font, mode, vertices, fill_result, engine, hover):
+    """Draw the control panel; returns its rect"""
     panel_x = DRAW_AREA[0]
     pygame.draw.rect(screen, PANEL_COLOR, (panel_x, 0, PANEL_AREA[0], PANEL_AREA[1]))
     
     # Title
-    title = font.render("Polygon Fill Algorithms", True, TEXT_COLOR)
+    title = render_text(font, "Polygon Fill Algorithms", TEXT_COLOR)
     screen.blit(title, (panel_x + 20, 20))
     
-    subtitle = small_font.render("Interactive Fill Algorithms", True, ACCENT_COLOR)
+    subtitle = render_text(small_font, "Interactive Fill Algorithms", ACCENT_COLOR)
     screen.blit(subtitle, (panel_x + 20, 55))
     
     # Instructions
@@ -274,29 +1513,32 @@ def draw_panel(screen, font, small_font, mode, vertices, fill_result):
         "Controls:",
         "Click to add vertices (yellow)",
         "Right-click to complete",
-        "",
+        "Drag a vertex after 1 to edit",
         "1 - Scanline Fill (Green)",
         "2 - Flood Fill 4-conn (Blue)",
         "3 - Flood Fill 8-conn (Magenta)",
-        "4 - Boundary Fill (Orange)",
-        "",
-        "C - Clear all",
-        "ESC - Clear vertices only",
-        "",
+        "4/8 - Boundary / span boundary",
+        "5 - Span Flood Fill (Cyan)",
+        "6/7 - Non-zero / Even-odd fill",
+        "V - Toggle 2-4 engine",
+        "T - Triangles, M - Save mesh",
+        "C - Clear all, ESC - vertices",
         f"Mode: {mode}",
-        f"Vertices: {len(vertices)}"
+        f"Engine: {engine}",
+        f"Vertices: {len(vertices)}",
+        f"Mouse: {hover}" if hover else ""
     ]
     
     for line in instructions:
-        txt = small_font.render(line, True, TEXT_COLOR)
+        txt = render_text(small_font, line, TEXT_COLOR)
         screen.blit(txt, (panel_x + 20, y))
-        y += 25
+        y += 22
     
     # Fill result
     if fill_result:
-        algo, pixels, duration = fill_result
+        algo, pixels, duration, detail = fill_result
         y += 20
-        screen.blit(font.render("Last Fill:", True, ACCENT_COLOR), (panel_x + 20, y))
+        screen.blit(render_text(font, "Last Fill:", ACCENT_COLOR), (panel_x + 20, y))
         y += 35
         
         # Color-code the algorithm name
@@ -309,15 +1551,208 @@ def draw_panel(screen, font, small_font, mode, vertices, fill_result):
             algo_color = FLOOD8_COLOR
         elif "Boundary" in algo:
             algo_color = BOUNDARY_FILL_COLOR
+        elif "Span" in algo:
+            algo_color = SPAN_FILL_COLOR
+        elif "Non-zero" in algo or "Even-odd" in algo:
+            algo_color = PATH_FILL_COLOR
+        elif "Triangle" in algo:
+            algo_color = TRIANGLE_COLOR
         
-        screen.blit(small_font.render(algo, True, algo_color), (panel_x + 20, y))
+        screen.blit(render_text(small_font, algo, algo_color), (panel_x + 20, y))
         y += 25
-        screen.blit(small_font.render(f"Pixels: {pixels}", True, TEXT_COLOR), (panel_x + 20, y))
+        screen.blit(render_text(small_font, f"Pixels: {pixels}", TEXT_COLOR), (panel_x + 20, y))
         y += 25
-        screen.blit(small_font.render(f"Time: {duration:.5f} s", True, TEXT_COLOR), (panel_x + 20, y))
+        screen.blit(render_text(small_font, f"Time: {duration:.5f} s", TEXT_COLOR), (panel_x + 20, y))
         y += 25
         if pixels > 0:
-            screen.blit(small_font.render(f"({duration/pixels*1e6:.3f} µs/pixel)", True, TEXT_COLOR), (panel_x + 20, y))
+            screen.blit(render_text(small_font, f"({duration/pixels*1e6:.3f} µs/pixel)", TEXT_COLOR), (panel_x + 20, y))
+            y += 25
+        if detail:
+            screen.blit(render_text(small_font, detail, TEXT_COLOR), (panel_x + 20, y))
+    return pygame.Rect(panel_x, 0, PANEL_AREA[0], PANEL_AREA[1])
+
+
+def make_polygon(kind, n, radius, center=None, rng=None):
+    """Benchmark polygon of about n vertices inside a 2*radius box.
+
+    convex: points on a circle with jittered angles. star: alternating
+    outer/inner radii. spiral: a thick arm winding outwards (outer wall,
+    then inner wall back). comb: teeth hanging from a base bar, the worst
+    case for span coherence.
+    """
+    rng = rng or random.Random(BENCH_SEED)
+    cx, cy = center or (DRAW_AREA[0] // 2, DRAW_AREA[1] // 2)
+    n = max(n, 4)
+    
+    if kind == "convex":
+        step = 2 * math.pi / n
+        angles = [i * step + rng.uniform(0, step * 0.5) for i in range(n)]
+        points = [(radius * math.cos(a), radius * math.sin(a)) for a in angles]
+    elif kind == "star":
+        points = [((radius if i % 2 == 0 else radius * 0.45) * math.cos(2 * math.pi * i / n),
+                   (radius if i % 2 == 0 else radius * 0.45) * math.sin(2 * math.pi * i / n)) for i in range(n)]
+    elif kind == "spiral":
+        side = n // 2
+        turns = max(0.5, min(2.5, n / 24))
+        spacing = 0.8 * radius / turns
+        wall = min(0.5 * spacing, 0.15 * radius)  # inner wall stays clear of the centre
+        outer, inner = [], []
+        for i in range(side):
+            a = 2 * math.pi * turns * i / (side - 1)
+            r = 0.2 * radius + spacing * a / (2 * math.pi)
+            outer.append((r * math.cos(a), r * math.sin(a)))
+            inner.append(((r - wall) * math.cos(a), (r - wall) * math.sin(a)))
+        points = outer + inner[::-1]
+    elif kind == "comb":
+        teeth = max(1, (n - 2) // 4)
+        pitch = 2 * radius / teeth
+        top, bottom = -radius, radius
+        points = [(-radius, bottom)]
+        for t in range(teeth):
+            x = -radius + t * pitch
+            points += [(x, top), (x + pitch / 2, top), (x + pitch / 2, bottom - 0.4 * radius),
+                       (x + pitch, bottom - 0.4 * radius)]
+        points.append((radius, bottom))
+    else:
+        raise ValueError(f"unknown polygon kind: {kind}")
+    return [(int(round(cx + px)), int(round(cy + py))) for px, py in points]
+
+
+def _interior_seed(surface, polygon, color):
+    """A pixel inside the polygon that still has `color`, for seeded fills"""
+    xs, ys = zip(*polygon)
+    gx, gy = np.meshgrid(np.arange(max(min(xs), 0), min(max(xs) + 1, surface.get_width())),
+                         np.arange(max(min(ys), 0), min(max(ys) + 1, surface.get_height())))
+    candidates = np.column_stack([gx.ravel(), gy.ravel()])
+    pixels = pygame.surfarray.pixels2d(surface)
+    free = pixels[candidates[:, 0], candidates[:, 1]] == surface.map_rgb(color)
+    del pixels
+    candidates = candidates[free]
+    candidates = candidates[PolygonIndex(polygon).contains(candidates)]
+    if not len(candidates):
+        return None
+    return tuple(int(v) for v in candidates[len(candidates) // 2])
+
+
+def bench_engines():
+    """(name, outline color or None, run(surface, polygon, prepared, seed, stats)).
+
+    Seeded engines run on a surface holding the polygon outline; the
+    others on a blank one. Edge tables and meshes are prepared outside the
+    timing, the way the UI reuses them.
+    """
+    def flood(fn, **kw):
+        def run(surf, poly, prep, seed, stats):
+            return fn(surf, seed[0], seed[1], FLOOD4_COLOR, BG_COLOR, stats=stats, **kw)
+        return run
+
+    def boundary(**kw):
+        def run(surf, poly, prep, seed, stats):
+            return boundary_fill(surf, seed[0], seed[1], BOUNDARY_FILL_COLOR, BOUNDARY_OUTLINE, stats=stats, **kw)
+        return run
+
+    return [
+        ("scanline", None, lambda surf, poly, prep, seed, stats: scanline_fill(surf, poly, SCANLINE_COLOR, stats=stats)),
+        ("scanline_parallel", None, lambda surf, poly, prep, seed, stats: scanline_fill_parallel(surf, [(poly, SCANLINE_COLOR)])),
+        ("evenodd", None, lambda surf, poly, prep, seed, stats: fill_path(surf, prep["table"], PATH_FILL_COLOR, "evenodd", stats=stats)),
+        ("nonzero", None, lambda surf, poly, prep, seed, stats: fill_path(surf, prep["table"], PATH_FILL_COLOR, "nonzero", stats=stats)),
+        ("triangles", None, lambda surf, poly, prep, seed, stats: prep["mesh"].fill(surf, TRIANGLE_COLOR)),
+        ("flood4", POLYGON_COLOR, flood(flood_fill_4)),
+        ("flood8", POLYGON_COLOR, flood(flood_fill_8)),
+        ("flood4_components", POLYGON_COLOR, flood(flood_fill_4, engine="components")),
+        ("flood8_components", POLYGON_COLOR, flood(flood_fill_8, engine="components")),
+        ("span4", POLYGON_COLOR, flood(span_flood_fill)),
+        ("span8", POLYGON_COLOR, flood(span_flood_fill, connectivity=8)),
+        ("boundary", BOUNDARY_OUTLINE, boundary()),
+        ("boundary_components", BOUNDARY_OUTLINE, boundary(engine="components")),
+        ("boundary_spans", BOUNDARY_OUTLINE, lambda surf, poly, prep, seed, stats: boundary_fill_spans(
+            surf, seed[0], seed[1], BOUNDARY_FILL_COLOR, BOUNDARY_OUTLINE, stats=stats)),
+    ]
+
+
+def benchmark_matrix(kinds=BENCH_KINDS, vertex_counts=BENCH_VERTICES, radii=BENCH_RADII,
+                     repeats=BENCH_REPEATS, seed=BENCH_SEED, engines=None):
+    """Headless, seeded run of every fill engine over a grid of polygons.
+
+    Each cell is timed `repeats` times on a freshly prepared surface, then
+    run once more under tracemalloc for the peak of Python/NumPy memory
+    (kept apart so tracing never skews the timings). Queue, stack and
+    active-edge high-water marks come from the fills' `stats` dicts.
+    Returns a dict ready for json.dump with one flat row per cell.
+    """
+    surf = pygame.Surface(DRAW_AREA)
+    results = []
+    for kind in kinds:
+        for n in vertex_counts:
+            for radius in radii:
+                polygon = make_polygon(kind, n, radius, rng=random.Random(seed))
+                prepared = {"table": EdgeTable([polygon]), "mesh": TriangleMesh(polygon)}
+                
+                for name, outline, run in bench_engines():
+                    if engines and name not in engines:
+                        continue
+                    
+                    def prepare():
+                        surf.fill(BG_COLOR)
+                        if outline:
+                            draw_polygon(surf, polygon, outline)
+                    
+                    prepare()
+                    seed_point = _interior_seed(surf, polygon, BG_COLOR) if outline else None
+                    if outline and seed_point is None:
+                        continue
+                    
+                    passes, stats = [], {}
+                    for _ in range(repeats):
+                        prepare()
+                        t0 = time.perf_counter()
+                        pixels = run(surf, polygon, prepared, seed_point, stats)
+                        passes.append(time.perf_counter() - t0)
+                    
+                    prepare()
+                    tracemalloc.start()
+                    run(surf, polygon, prepared, seed_point, {})
+                    _, peak = tracemalloc.get_traced_memory()
+                    tracemalloc.stop()
+                    
+                    seconds = float(np.median(passes))
+                    results.append({
+                        "kind": kind,
+                        "vertices": len(polygon),
+                        "radius": radius,
+                        "engine": name,
+                        "pixels": int(pixels),
+                        "seconds": seconds,
+                        "us_per_pixel": seconds / pixels * 1e6 if pixels else None,
+                        "peak_kb": peak / 1024,
+                        "max_queue": stats.get("max_queue"),
+                        "max_stack": stats.get("max_stack"),
+                        "max_active": stats.get("max_active"),
+                        "runs": stats.get("runs"),
+                    })
+    
+    return {
+        "seed": seed,
+        "repeats": repeats,
+        "surface": list(DRAW_AREA),
+        "results": results,
+    }
+
+
+def write_report(report, path=None, fmt="json"):
+    """Write the benchmark as JSON, or as CSV with one row per cell"""
+    out = open(path, "w", newline="") if path else sys.stdout
+    try:
+        if fmt == "csv":
+            writer = csv.DictWriter(out, fieldnames=list(report["results"][0]) if report["results"] else [])
+            writer.writeheader()
+            writer.writerows(report["results"])
+        else:
+            json.dump(report, out, indent=2)
+            out.write("\n")
+    finally:
+        if path:
+            out.close()
 
 
 def main():
@@ -333,123 +1768,295 @@ def main():
     
     vertices = []
     polygon_closed = False
+    edge_table = None
+    poly_index = None
+    retained = None
+    live_edit = False
+    drag_index = None
+    hover = None
     mode = "Drawing"
     fill_result = None
+    engine = "queue"
     running = True
     
+    # Only rects listed here are copied to the screen and pushed to the display
+    dirty = [draw_surface.get_rect()]
+    shown_panel = None
+    
     while running:
         for ev in pygame.event.get():
             if ev.type == pygame.QUIT:
                 running = False
             
+            elif ev.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE):
+                # The compositor dropped our pixels: repaint everything
+                dirty.append(draw_surface.get_rect())
+                shown_panel = None
+            
             elif ev.type == pygame.MOUSEBUTTONDOWN:
                 mx, my = ev.pos
                 
                 if ev.button == 1 and mx < DRAW_AREA[0]:  # Left click
-                    if not polygon_closed:
+                    if polygon_closed and live_edit:
+                        drag_index = retained.nearest_vertex((mx, my))
+                    elif not polygon_closed:
                         vertices.append((mx, my))
                         # Draw vertex
-                        pygame.draw.circle(draw_surface, VERTEX_COLOR, (mx, my), 4)
+                        dirty.append(pygame.draw.circle(draw_surface, VERTEX_COLOR, (mx, my), VERTEX_RADIUS))
                         # Draw edge from previous vertex with thickness
                         if len(vertices) > 1:
                             x1, y1 = vertices[-2]
                             x2, y2 = vertices[-1]
-                            draw_line_bresenham(draw_surface, x1, y1, x2, y2, POLYGON_COLOR)
-                            # Add thickness to prevent gaps
-                            for dx in range(-2, 3):
-                                for dy in range(-2, 3):
-                                    if dx*dx + dy*dy <= 4:
-                                        draw_line_bresenham(draw_surface, x1+dx, y1+dy, x2+dx, y2+dy, POLYGON_COLOR)
+                            width = 2 * OUTLINE_THICKNESS + 1
+                            draw_thick_line(draw_surface, x1, y1, x2, y2, POLYGON_COLOR, width)
+                            dirty.append(stroke_rect(vertices[-2:], width))
                 
                 elif ev.button == 3 and mx < DRAW_AREA[0]:  # Right click
                     if len(vertices) >= 3 and not polygon_closed:
                         # Close polygon with thick lines to prevent gaps
-                        draw_polygon(draw_surface, vertices, POLYGON_COLOR)
+                        dirty.append(draw_polygon(draw_surface, vertices, POLYGON_COLOR))
                         polygon_closed = True
+                        edge_table = EdgeTable([vertices])
+                        poly_index = PolygonIndex(vertices)
+                        retained = RetainedPolygon(vertices)
                         mode = "Ready to Fill"
             
+            elif ev.type == pygame.MOUSEBUTTONUP and ev.button == 1 and drag_index is not None:
+                # Edit finished: rebuild the whole-polygon structures once
+                drag_index = None
+                edge_table = EdgeTable([vertices])
+                poly_index = PolygonIndex(vertices)
+            
+            elif ev.type == pygame.MOUSEMOTION and drag_index is not None and retained is not None and live_edit:
+                mx = min(max(ev.pos[0], 0), DRAW_AREA[0] - 1)
+                my = min(max(ev.pos[1], 0), DRAW_AREA[1] - 1)
+                changed = retained.move_vertex(drag_index, (mx, my))
+                vertices[drag_index] = (mx, my)
+                dirty.append(retained.redraw(draw_surface, changed, SCANLINE_COLOR, POLYGON_COLOR, BG_COLOR))
+            
+            elif ev.type == pygame.MOUSEMOTION and polygon_closed:
+                mx, my = ev.pos
+                if mx < DRAW_AREA[0]:
+                    hover = "inside" if poly_index.contains([(mx, my)])[0] else "outside"
+            
             elif ev.type == pygame.KEYDOWN:
+                if drag_index is not None:
+                    # The key may end the drag, so bring the tables up to date first
+                    edge_table = EdgeTable([vertices])
+                    poly_index = PolygonIndex(vertices)
+                
                 if ev.key == pygame.K_c:
                     draw_surface.fill(BG_COLOR)
+                    dirty.append(draw_surface.get_rect())
+                    retained = None
+                    live_edit = False
+                    drag_index = None
                     vertices = []
                     polygon_closed = False
+                    hover = None
                     mode = "Drawing"
                     fill_result = None
                 
                 elif ev.key == pygame.K_ESCAPE:
                     draw_surface.fill(BG_COLOR)
+                    dirty.append(draw_surface.get_rect())
+                    retained = None
+                    live_edit = False
+                    drag_index = None
                     vertices = []
                     polygon_closed = False
+                    hover = None
                     mode = "Drawing"
                     fill_result = None
                 
+                elif ev.key == pygame.K_v:
+                    engine = "components" if engine == "queue" else "queue"
+                
                 elif ev.key == pygame.K_1 and polygon_closed:
                     # Scanline Fill
                     draw_surface.fill(BG_COLOR)
+                    dirty.append(draw_surface.get_rect())
                     t0 = time.perf_counter()
                     pixels = scanline_fill(draw_surface, vertices, SCANLINE_COLOR)
                     duration = time.perf_counter() - t0
                     draw_polygon(draw_surface, vertices, POLYGON_COLOR)
                     for v in vertices:
-                        pygame.draw.circle(draw_surface, VERTEX_COLOR, v, 4)
+                        pygame.draw.circle(draw_surface, VERTEX_COLOR, v, VERTEX_RADIUS)
+                    live_edit = True
                     mode = "Scanline Fill (Green)"
-                    fill_result = ("Scanline Fill", pixels, duration)
+                    fill_result = ("Scanline Fill", pixels, duration, "")
                 
                 elif ev.key == pygame.K_2 and polygon_closed:
                     # Flood Fill 4-connected
                     draw_surface.fill(BG_COLOR)
+                    dirty.append(draw_surface.get_rect())
+                    live_edit = False
+                    drag_index = None
                     draw_polygon(draw_surface, vertices, POLYGON_COLOR)
                     # Find a point inside polygon
                     cx = sum(v[0] for v in vertices) // len(vertices)
                     cy = sum(v[1] for v in vertices) // len(vertices)
+                    scratch = draw_surface.copy()
                     t0 = time.perf_counter()
-                    pixels = flood_fill_4(draw_surface, cx, cy, FLOOD4_COLOR, BG_COLOR)
+                    pixels = flood_fill_4(draw_surface, cx, cy, FLOOD4_COLOR, BG_COLOR, engine=engine)
                     duration = time.perf_counter() - t0
                     draw_polygon(draw_surface, vertices, POLYGON_COLOR)
                     for v in vertices:
-                        pygame.draw.circle(draw_surface, VERTEX_COLOR, v, 4)
+                        pygame.draw.circle(draw_surface, VERTEX_COLOR, v, VERTEX_RADIUS)
                     mode = "Flood Fill 4-conn (Blue)"
-                    fill_result = ("Flood Fill 4-connected", pixels, duration)
+                    note = fill_memory_note(scratch, flood_fill_4, cx, cy, FLOOD4_COLOR, BG_COLOR, engine=engine)
+                    fill_result = ("Flood Fill 4-connected", pixels, duration, note)
                 
                 elif ev.key == pygame.K_3 and polygon_closed:
                     # Flood Fill 8-connected
                     draw_surface.fill(BG_COLOR)
+                    dirty.append(draw_surface.get_rect())
+                    live_edit = False
+                    drag_index = None
                     draw_polygon(draw_surface, vertices, POLYGON_COLOR)
                     cx = sum(v[0] for v in vertices) // len(vertices)
                     cy = sum(v[1] for v in vertices) // len(vertices)
+                    scratch = draw_surface.copy()
                     t0 = time.perf_counter()
-                    pixels = flood_fill_8(draw_surface, cx, cy, FLOOD8_COLOR, BG_COLOR)
+                    pixels = flood_fill_8(draw_surface, cx, cy, FLOOD8_COLOR, BG_COLOR, engine=engine)
                     duration = time.perf_counter() - t0
                     draw_polygon(draw_surface, vertices, POLYGON_COLOR)
                     for v in vertices:
-                        pygame.draw.circle(draw_surface, VERTEX_COLOR, v, 4)
+                        pygame.draw.circle(draw_surface, VERTEX_COLOR, v, VERTEX_RADIUS)
                     mode = "Flood Fill 8-conn (Magenta)"
-                    fill_result = ("Flood Fill 8-connected", pixels, duration)
+                    note = fill_memory_note(scratch, flood_fill_8, cx, cy, FLOOD8_COLOR, BG_COLOR, engine=engine)
+                    fill_result = ("Flood Fill 8-connected", pixels, duration, note)
                 
                 elif ev.key == pygame.K_4 and polygon_closed:
                     # Boundary Fill
                     draw_surface.fill(BG_COLOR)
+                    dirty.append(draw_surface.get_rect())
+                    live_edit = False
+                    drag_index = None
                     draw_polygon(draw_surface, vertices, BOUNDARY_OUTLINE)
                     cx = sum(v[0] for v in vertices) // len(vertices)
                     cy = sum(v[1] for v in vertices) // len(vertices)
+                    scratch = draw_surface.copy()
                     t0 = time.perf_counter()
-                    pixels = boundary_fill(draw_surface, cx, cy, BOUNDARY_FILL_COLOR, BOUNDARY_OUTLINE)
+                    pixels = boundary_fill(draw_surface, cx, cy, BOUNDARY_FILL_COLOR, BOUNDARY_OUTLINE, engine=engine)
                     duration = time.perf_counter() - t0
                     draw_polygon(draw_surface, vertices, BOUNDARY_OUTLINE)
                     for v in vertices:
-                        pygame.draw.circle(draw_surface, VERTEX_COLOR, v, 4)
+                        pygame.draw.circle(draw_surface, VERTEX_COLOR, v, VERTEX_RADIUS)
                     mode = "Boundary Fill (Orange)"
-                    fill_result = ("Boundary Fill", pixels, duration)
+                    note = fill_memory_note(scratch, boundary_fill, cx, cy, BOUNDARY_FILL_COLOR, BOUNDARY_OUTLINE, engine=engine)
+                    fill_result = ("Boundary Fill", pixels, duration, note)
+                
+                elif ev.key == pygame.K_8 and polygon_closed:
+                    # Boundary fill over an explicit span stack
+                    draw_surface.fill(BG_COLOR)
+                    dirty.append(draw_surface.get_rect())
+                    live_edit = False
+                    drag_index = None
+                    draw_polygon(draw_surface, vertices, BOUNDARY_OUTLINE)
+                    cx = sum(v[0] for v in vertices) // len(vertices)
+                    cy = sum(v[1] for v in vertices) // len(vertices)
+                    stats = {}
+                    t0 = time.perf_counter()
+                    pixels = boundary_fill_spans(draw_surface, cx, cy, BOUNDARY_FILL_COLOR, BOUNDARY_OUTLINE, stats=stats)
+                    duration = time.perf_counter() - t0
+                    draw_polygon(draw_surface, vertices, BOUNDARY_OUTLINE)
+                    for v in vertices:
+                        pygame.draw.circle(draw_surface, VERTEX_COLOR, v, VERTEX_RADIUS)
+                    mode = "Span Boundary Fill (Orange)"
+                    fill_result = ("Span Boundary Fill", pixels, duration, f"Max stack: {stats.get('max_stack', 0)} spans")
+                
+                elif ev.key == pygame.K_5 and polygon_closed:
+                    # Span (scanline seed) Flood Fill
+                    draw_surface.fill(BG_COLOR)
+                    dirty.append(draw_surface.get_rect())
+                    live_edit = False
+                    drag_index = None
+                    draw_polygon(draw_surface, vertices, POLYGON_COLOR)
+                    cx = sum(v[0] for v in vertices) // len(vertices)
+                    cy = sum(v[1] for v in vertices) // len(vertices)
+                    t0 = time.perf_counter()
+                    pixels = span_flood_fill(draw_surface, cx, cy, SPAN_FILL_COLOR, BG_COLOR)
+                    duration = time.perf_counter() - t0
+                    draw_polygon(draw_surface, vertices, POLYGON_COLOR)
+                    for v in vertices:
+                        pygame.draw.circle(draw_surface, VERTEX_COLOR, v, VERTEX_RADIUS)
+                    mode = "Span Flood Fill (Cyan)"
+                    fill_result = ("Span Flood Fill", pixels, duration, "")
+                
+                elif ev.key in (pygame.K_6, pygame.K_7) and polygon_closed:
+                    # Winding-rule fill, reusing the edge table built on close
+                    rule = "nonzero" if ev.key == pygame.K_6 else "evenodd"
+                    draw_surface.fill(BG_COLOR)
+                    dirty.append(draw_surface.get_rect())
+                    live_edit = False
+                    drag_index = None
+                    t0 = time.perf_counter()
+                    pixels = fill_path(draw_surface, edge_table, PATH_FILL_COLOR, rule)
+                    duration = time.perf_counter() - t0
+                    draw_polygon(draw_surface, vertices, POLYGON_COLOR)
+                    for v in vertices:
+                        pygame.draw.circle(draw_surface, VERTEX_COLOR, v, VERTEX_RADIUS)
+                    name = "Non-zero Fill" if rule == "nonzero" else "Even-odd Fill"
+                    mode = f"{name} (Lavender)"
+                    fill_result = (name, pixels, duration, "")
+                
+                elif ev.key == pygame.K_t and polygon_closed:
+                    # Triangle fill; the mesh is rebuilt only after a vertex edit
+                    draw_surface.fill(BG_COLOR)
+                    dirty.append(draw_surface.get_rect())
+                    live_edit = False
+                    drag_index = None
+                    t0 = time.perf_counter()
+                    mesh = retained.mesh()
+                    pixels = mesh.fill(draw_surface, TRIANGLE_COLOR)
+                    duration = time.perf_counter() - t0
+                    mesh.draw_wireframe(draw_surface, MESH_COLOR)
+                    draw_polygon(draw_surface, vertices, POLYGON_COLOR)
+                    for v in vertices:
+                        pygame.draw.circle(draw_surface, VERTEX_COLOR, v, VERTEX_RADIUS)
+                    mode = f"Triangles: {len(mesh.triangles)}"
+                    fill_result = ("Triangle Fill", pixels, duration, "")
+                
+                elif ev.key == pygame.K_m and polygon_closed:
+                    retained.mesh().export(MESH_EXPORT_PATH)
+                    mode = f"Saved {MESH_EXPORT_PATH}"
         
-        screen.blit(draw_surface, (0, 0))
-        draw_panel(screen, font, small_font, mode, vertices, fill_result)
+        for rect in dirty:
+            rect = rect.clip(draw_surface.get_rect())
+            screen.blit(draw_surface, rect, rect)
+        panel_state = (mode, len(vertices), fill_result, engine, hover)
+        if panel_state != shown_panel:
+            dirty.append(draw_panel(screen, font, small_font, mode, vertices, fill_result, engine, hover))
+            shown_panel = panel_state
         
-        pygame.display.flip()
+        if dirty:
+            pygame.display.update(dirty)
+            dirty = []
         clock.tick(60)
     
     pygame.quit()
     sys.exit()
 
 
+def parse_args():
+    parser = argparse.ArgumentParser(description="Polygon fill algorithms demo")
+    parser.add_argument("--bench", action="store_true", help="run the headless fill benchmark matrix")
+    parser.add_argument("--kinds", nargs="+", default=list(BENCH_KINDS), choices=BENCH_KINDS)
+    parser.add_argument("--vertices", nargs="+", type=int, default=list(BENCH_VERTICES))
+    parser.add_argument("--radii", nargs="+", type=int, default=list(BENCH_RADII))
+    parser.add_argument("--engines", nargs="+", help="only run these engines")
+    parser.add_argument("--repeats", type=int, default=BENCH_REPEATS, help="timed passes per cell")
+    parser.add_argument("--seed", type=int, default=BENCH_SEED)
+    parser.add_argument("--format", choices=("json", "csv"), default="json")
+    parser.add_argument("--out", help="write the report here instead of stdout")
+    return parser.parse_args()
+
+
 if __name__ == "__main__":
+    args = parse_args()
+    if args.bench:
+        report = benchmark_matrix(args.kinds, args.vertices, args.radii, args.repeats, args.seed, args.engines)
+        write_report(report, args.out, args.format)
+        sys.exit(0)
     main()
\ No newline at end of file
@@ -0,0 +1,59 @@
+import os
+import random
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import numpy as np
+import pygame
+import pytest
+
+from polygonFillingAlgos import boundary_fill, boundary_fill_spans, scanline_fill, scanline_fill_parallel
+
+SIZE = 96
+
+
+@pytest.fixture
+def display():
+    """pygame initialised with a window, as in the GUI"""
+    pygame.init()
+    pygame.display.set_mode((SIZE, SIZE))
+    yield
+    pygame.quit()
+
+
+def random_layers(rng, count=3):
+    return [([(rng.randrange(SIZE), rng.randrange(SIZE)) for _ in range(rng.randrange(3, 9))],
+             (rng.randrange(1, 256), rng.randrange(256), rng.randrange(256)))
+            for _ in range(count)]
+
+
+def test_parallel_fill_matches_scanline_fill_after_pygame_init(display):
+    # Workers forked after pygame.init() ignore SIGTERM, so a pool that is
+    # terminated instead of joined could hang on any later call
+    rng = random.Random(0)
+    for _ in range(10):
+        layers = random_layers(rng)
+        expected = pygame.Surface((SIZE, SIZE))
+        filled = sum(scanline_fill(expected, polygon, color) for polygon, color in layers)
+        surface = pygame.Surface((SIZE, SIZE))
+        assert scanline_fill_parallel(surface, layers, workers=4) == filled
+        assert (pygame.surfarray.array2d(surface) == pygame.surfarray.array2d(expected)).all()
+
+
+@pytest.mark.parametrize("density", [0.2, 0.3, 0.4])
+def test_span_boundary_fill_matches_boundary_fill_with_bounded_stack(density):
+    boundary, fill = (255, 50, 50), (255, 200, 100)
+    surface = pygame.Surface((SIZE, SIZE))
+    pixels = pygame.surfarray.pixels2d(surface)
+    noise = np.random.default_rng(int(density * 10)).random((SIZE, SIZE))
+    pixels[noise < density] = surface.map_rgb(boundary)
+    pixels[noise > 0.97] = surface.map_rgb(fill)  # pre-existing fill pixels are walls
+    pixels[SIZE // 2, SIZE // 2] = 0
+    del pixels
+
+    expected = surface.copy()
+    filled = boundary_fill(expected, SIZE // 2, SIZE // 2, fill, boundary)
+    stats = {}
+    assert boundary_fill_spans(surface, SIZE // 2, SIZE // 2, fill, boundary, stats=stats) == filled
+    assert (pygame.surfarray.array2d(surface) == pygame.surfarray.array2d(expected)).all()
+    assert stats["max_stack"] <= 2 * SIZE